@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Global Claude Rules - SessionStart Git Info Benchmark
+
+Compares the previous six-command git collection in the SessionStart hook
+with the batched `git status --porcelain=v2 --branch` + `git log -1`
+collector and with the .git metadata reader (status only), reporting
+subprocess count and wall time for each.
+
+Usage:
+    python benchmarks/bench_git_info.py
+    python benchmarks/bench_git_info.py --repo /path/to/large/repo --repeat 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared import git_metadata  # noqa: E402
+
+HOOK_PATH = Path(__file__).parent.parent / "templates" / "session_start__show_project_info.py"
+
+
+class CountingPopen(subprocess.Popen):
+    """Popen subclass that counts spawned processes."""
+
+    count = 0
+
+    def __init__(self, *args, **kwargs):
+        CountingPopen.count += 1
+        super().__init__(*args, **kwargs)
+
+
+def load_hook_module(with_metadata_reader: bool):
+    """Import the SessionStart hook template as a module.
+
+    The template's lib/ modules are not importable from the repository, so
+    the metadata reader is attached explicitly when requested.
+    """
+    spec = importlib.util.spec_from_file_location("session_start_hook", HOOK_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    if with_metadata_reader:
+        module.read_git_metadata = git_metadata.read_git_metadata
+        module.format_relative_time = git_metadata.format_relative_time
+    else:
+        module.read_git_metadata = lambda start: None
+    return module
+
+
+def _run_git(cmd: list[str]) -> str:
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=3)
+        return result.stdout.strip() if result.returncode == 0 else ""
+    except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError, OSError):
+        return ""
+
+
+def legacy_get_git_info() -> dict:
+    """The previous six-subprocess collector, kept for comparison."""
+    git_commands = [
+        (["git", "branch", "--show-current"], "branch"),
+        (["git", "rev-parse", "--abbrev-ref", "HEAD"], "head_ref"),
+        (["git", "rev-parse", "--short", "HEAD"], "head_commit"),
+        (["git", "log", "--pretty=format:%h %s", "-1"], "last_commit"),
+        (["git", "log", "--pretty=format:%ar", "-1"], "commit_time"),
+        (["git", "status", "--porcelain"], "changes_raw"),
+    ]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {key: executor.submit(_run_git, cmd) for cmd, key in git_commands}
+        results = {key: future.result() for key, future in futures.items()}
+
+    branch = results["branch"]
+    if not branch and results["head_ref"] == "HEAD":
+        branch = f"HEAD detached at {results['head_commit']}"
+    return {
+        "branch": branch or "No commits yet",
+        "last_commit": results["last_commit"] or "No commits yet",
+        "commit_time": results["commit_time"],
+        "changes": len(results["changes_raw"].splitlines()),
+        "git_initialized": True,
+    }
+
+
+def measure(func, repeat: int) -> tuple[float, float, dict]:
+    """Return (best ms, subprocesses per call, last result)."""
+    best = float("inf")
+    CountingPopen.count = 0
+    result = {}
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, CountingPopen.count / repeat, result
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark SessionStart git info collection")
+    parser.add_argument(
+        "--repo",
+        default=".",
+        help="Git repository to run in (default: current directory)"
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Runs per collector; the best time is reported (default: 5)"
+    )
+    args = parser.parse_args()
+
+    collectors = [
+        ("legacy", legacy_get_git_info),
+        ("batched", load_hook_module(with_metadata_reader=False).get_git_info),
+        ("metadata", load_hook_module(with_metadata_reader=True).get_git_info),
+    ]
+    os.chdir(args.repo)
+    subprocess.Popen = CountingPopen
+
+    print(f"{'collector':<10} {'subprocesses':>12} {'best ms':>9}")
+    results = {}
+    for name, func in collectors:
+        ms, procs, results[name] = measure(func, args.repeat)
+        print(f"{name:<10} {procs:>12.0f} {ms:>9.1f}")
+
+    status = 0
+    for name in ("batched", "metadata"):
+        for key in ("branch", "last_commit", "commit_time", "changes"):
+            if results["legacy"].get(key) != results[name].get(key):
+                print(f"Mismatch in {name} {key}: {results['legacy'].get(key)!r} != {results[name].get(key)!r}")
+                status = 1
+
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Global Claude Rules - Rule Parser Benchmark
+
+Times the single-pass rule parser on synthetic memory.md files generated
+by corpus.py and shows that parse time per rule stays flat as the rule
+count grows.
+
+Usage:
+    python benchmarks/bench_rule_parser.py
+    python benchmarks/bench_rule_parser.py --sizes 10000 50000 100000
+    python benchmarks/bench_rule_parser.py --legacy
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import generate_memory  # noqa: E402
+from shared.rule_parser import parse_rules  # noqa: E402
+from validate_rules import parse_err_rule  # noqa: E402
+
+
+def legacy_find_all_rules(content: str) -> list[dict]:
+    """The previous rules x lines implementation, kept for comparison."""
+    rules = []
+    for i, line in enumerate(content.split("\n")):
+        if re.match(r'###\s+ERR-\d+:', line):
+            rule, _ = parse_err_rule(content, i)
+            if rule['id']:
+                rules.append(rule)
+    return rules
+
+
+def time_call(func, content: str, repeat: int) -> float:
+    """Return the best wall time in milliseconds over ``repeat`` runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(content)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the ERR rule parser")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10000, 50000],
+        help="Rule counts to benchmark (default: 10000 50000)"
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Runs per size; the best time is reported (default: 3)"
+    )
+    parser.add_argument(
+        "--legacy",
+        action="store_true",
+        help="Also time the legacy parser at 1/10 of each size (it is quadratic)"
+    )
+    args = parser.parse_args()
+
+    print(f"{'rules':>8} {'size':>10} {'parse ms':>10} {'us/rule':>9}")
+    for size in args.sizes:
+        content = generate_memory(size)
+        ms = time_call(parse_rules, content, args.repeat)
+        print(f"{size:>8} {len(content) // 1024:>8}KB {ms:>10.1f} {ms * 1000 / size:>9.2f}")
+
+    if args.legacy:
+        print(f"\n{'rules':>8} {'legacy ms':>10} {'single ms':>10}")
+        for size in args.sizes:
+            small = max(size // 10, 1)
+            content = generate_memory(small)
+            legacy_ms = time_call(legacy_find_all_rules, content, 1)
+            single_ms = time_call(parse_rules, content, args.repeat)
+            print(f"{small:>8} {legacy_ms:>10.1f} {single_ms:>10.1f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
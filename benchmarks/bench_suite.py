@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Global Claude Rules - Benchmark Suite
+
+Times the rule pipeline on deterministic synthetic corpora (see corpus.py)
+and writes machine-readable results that can be diffed between releases:
+
+- find_all_rules         scripts/validate_rules.py parse
+- validate_rules         full validation of the parsed rules
+- inject_global_rules.cold   SessionStart rule injection, snapshot rebuilt
+- inject_global_rules.warm   SessionStart rule injection from the snapshot
+- keyword_matcher / semantic_matcher   rule matching per tool call, when
+  semantic_matcher.py is installed in .claude/hooks/moai (skipped otherwise)
+
+Matcher results are checked against the documented targets (search under
+100 ms at 100 and 1000 rules).
+
+Usage:
+    python benchmarks/bench_suite.py
+    python benchmarks/bench_suite.py --sizes 100 1000 --output results.json
+    python benchmarks/bench_suite.py --compare previous.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+sys.path.insert(0, str(ROOT_DIR / "scripts"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import CATEGORIES, generate_memory  # noqa: E402
+from shared import rule_snapshot  # noqa: E402
+from shared.git_metadata import read_git_metadata  # noqa: E402
+from validate_rules import find_all_rules, validate_rules  # noqa: E402
+
+RESULTS_VERSION = 1
+HOOK_PATH = ROOT_DIR / "templates" / "session_start__show_project_info.py"
+HOOKS_DIR = ROOT_DIR / ".claude" / "hooks" / "moai"
+
+# Documented matcher targets (SPEC-SEMANTIC-001 acceptance, CHANGELOG 1.6.0)
+MATCHER_TARGET_MS = 100.0
+MATCHER_TARGET_MAX_RULES = 1000
+
+
+def time_call(func, repeat: int) -> dict:
+    """Run func ``repeat`` times and return best/median milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        "best_ms": round(min(samples), 3),
+        "median_ms": round(statistics.median(samples), 3),
+        "runs": repeat,
+    }
+
+
+def load_hook_module():
+    """Import the SessionStart hook template as a module."""
+    spec = importlib.util.spec_from_file_location("session_start_hook", HOOK_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def bench_inject_global_rules(memory_path: Path, work_dir: Path, repeat: int) -> dict[str, dict]:
+    """Time rule injection with and without a current snapshot.
+
+    The hook's lib/ modules are not importable from the repository, so the
+    shared snapshot loader is attached with a snapshot file in work_dir.
+    """
+    hook = load_hook_module()
+    snapshot_path = work_dir / "rules_snapshot.json"
+    hook.load_rule_snapshot = lambda path, _snapshot=None: rule_snapshot.load_rule_snapshot(path, snapshot_path)
+
+    def run(cold: bool):
+        if cold and snapshot_path.exists():
+            snapshot_path.unlink()
+        hook._hook_paths = None
+        hook._global_snapshot = None
+        hook.inject_global_rules()
+
+    old_cwd, old_memory = os.getcwd(), os.environ.get("GLOBAL_CLAUDE_MEMORY")
+    os.chdir(work_dir)
+    os.environ["GLOBAL_CLAUDE_MEMORY"] = str(memory_path)
+    try:
+        cold = time_call(lambda: run(cold=True), repeat)
+        run(cold=True)
+        warm = time_call(lambda: run(cold=False), repeat)
+    finally:
+        os.chdir(old_cwd)
+        if old_memory is None:
+            os.environ.pop("GLOBAL_CLAUDE_MEMORY", None)
+        else:
+            os.environ["GLOBAL_CLAUDE_MEMORY"] = old_memory
+    return {"inject_global_rules.cold": cold, "inject_global_rules.warm": warm}
+
+
+def matcher_queries() -> list[tuple[str, dict]]:
+    """One Bash and one Write tool call per category vocabulary."""
+    queries = []
+    for name, _label, vocabulary in CATEGORIES:
+        queries.append(("Bash", {"command": f"{vocabulary[0]} {vocabulary[1]} --{vocabulary[2]}"}))
+        queries.append(("Write", {"file_path": f"/project/{name}/{vocabulary[3]}.py"}))
+    return queries
+
+
+def load_matchers() -> tuple[dict, str]:
+    """Import the matchers from the installed hooks, if present.
+
+    Returns:
+        ({name: matcher}, skip reason or "")
+    """
+    if str(HOOKS_DIR) not in sys.path:
+        sys.path.insert(0, str(HOOKS_DIR))
+    try:
+        from semantic_matcher import HAS_SEMANTIC, KeywordRuleMatcher, SemanticRuleMatcher
+    except ImportError as e:
+        return {}, f"semantic_matcher not available: {e}"
+
+    matchers = {"keyword_matcher": KeywordRuleMatcher()}
+    if HAS_SEMANTIC:
+        matchers["semantic_matcher"] = SemanticRuleMatcher()
+    return matchers, "" if HAS_SEMANTIC else "semantic dependencies not installed"
+
+
+def run_suite(sizes: list[int], repeat: int, seed: int) -> dict:
+    """Run every benchmark for every corpus size."""
+    results = []
+    skipped = []
+    matchers, matcher_skip = load_matchers()
+    if matcher_skip:
+        names = ["semantic_matcher"] if matchers else ["keyword_matcher", "semantic_matcher"]
+        skipped.extend({"benchmark": name, "reason": matcher_skip} for name in names)
+    queries = matcher_queries()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        work_dir = Path(temp_dir)
+        for size in sizes:
+            content = generate_memory(size, seed)
+            memory_path = work_dir / f"memory-{size}.md"
+            memory_path.write_text(content, encoding="utf-8")
+            rules = find_all_rules(content)
+
+            timings = {
+                "find_all_rules": time_call(lambda: find_all_rules(content), repeat),
+                "validate_rules": time_call(lambda: validate_rules(content, rules=rules), repeat),
+            }
+            timings.update(bench_inject_global_rules(memory_path, work_dir, repeat))
+
+            for name, matcher in matchers.items():
+                per_query = time_call(lambda: [matcher.match(rules, *query) for query in queries], repeat)
+                for key in ("best_ms", "median_ms"):
+                    per_query[key] = round(per_query[key] / len(queries), 3)
+                per_query["queries"] = len(queries)
+                if size <= MATCHER_TARGET_MAX_RULES:
+                    per_query["target_ms"] = MATCHER_TARGET_MS
+                    per_query["meets_target"] = per_query["median_ms"] < MATCHER_TARGET_MS
+                timings[name] = per_query
+
+            for benchmark, timing in timings.items():
+                results.append({
+                    "benchmark": benchmark,
+                    "rules": size,
+                    "bytes": len(content.encode("utf-8")),
+                    **timing,
+                })
+
+    metadata = read_git_metadata(ROOT_DIR)
+    return {
+        "version": RESULTS_VERSION,
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": metadata["head_commit"] if metadata else "",
+        "python": platform.python_version(),
+        "platform": sys.platform,
+        "seed": seed,
+        "results": results,
+        "skipped": skipped,
+    }
+
+
+def compare(current: dict, previous: dict) -> list[str]:
+    """Describe median changes per benchmark and size against older results."""
+    previous_results = {(r["benchmark"], r["rules"]): r for r in previous.get("results", [])}
+    lines = []
+    for result in current["results"]:
+        old = previous_results.get((result["benchmark"], result["rules"]))
+        if not old or not old.get("median_ms"):
+            continue
+        ratio = result["median_ms"] / old["median_ms"]
+        lines.append(
+            f"{result['benchmark']:<26} {result['rules']:>6} "
+            f"{old['median_ms']:>10.2f} {result['median_ms']:>10.2f} {ratio:>7.2f}x"
+        )
+    return lines
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the rule pipeline on synthetic corpora")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[100, 1000, 10000, 50000],
+        help="Rule counts to benchmark (default: 100 1000 10000 50000)"
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Runs per benchmark (default: 3)"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Corpus seed (default: 0)"
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        help="Write results as JSON to this file"
+    )
+    parser.add_argument(
+        "--compare",
+        help="Previous results JSON to compare medians against"
+    )
+    args = parser.parse_args()
+
+    report = run_suite(args.sizes, args.repeat, args.seed)
+
+    print(f"{'benchmark':<26} {'rules':>6} {'best ms':>10} {'median ms':>10}")
+    for result in report["results"]:
+        print(f"{result['benchmark']:<26} {result['rules']:>6} {result['best_ms']:>10.2f} {result['median_ms']:>10.2f}")
+    for skip in report["skipped"]:
+        print(f"skipped {skip['benchmark']}: {skip['reason']}")
+
+    if args.compare:
+        previous = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        print(f"\n{'benchmark':<26} {'rules':>6} {'old ms':>10} {'new ms':>10} {'ratio':>8}")
+        for line in compare(report, previous):
+            print(line)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"\nResults written to {args.output}")
+
+    missed = [r for r in report["results"] if r.get("meets_target") is False]
+    return 1 if missed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Global Claude Rules - Synthetic Rule Corpus Generator
+
+Generates deterministic memory.md files with N rules spread round-robin
+over all seven category ranges (ERR-001~099 ... ERR-600~699), in the same
+layout as templates/memory.md: essential section, rules with every field,
+and the Error Quick Reference Table. The same (rule_count, seed) always
+produces byte-identical output, so benchmark results can be compared
+between releases.
+
+Each category has 99 IDs per block (ERR-x01 to ERR-x99). The first
+693 rules use the standard ERR-001 to ERR-699 ranges; larger corpora
+continue in blocks of 1000 that keep the category in the hundreds digit
+(ERR-1101 is a Git/Version control rule).
+
+Usage:
+    python benchmarks/corpus.py 1000 -o /tmp/memory.md
+    python benchmarks/corpus.py 50000 --seed 7 -o /tmp/memory-50k.md
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+from pathlib import Path
+
+# (name, category label, vocabulary) per hundreds digit; labels match
+# validate_rules.validate_category_range
+CATEGORIES = [
+    ("general", "General/System errors (ERR-001~ERR-099)",
+     ["file", "path", "tool", "hook", "encoding", "permission", "config", "python", "glob", "task"]),
+    ("git", "Git/Version control (ERR-100~ERR-199)",
+     ["git", "branch", "merge", "rebase", "commit", "push", "remote", "conflict", "stash", "tag"]),
+    ("build", "Build/Compilation (ERR-200~ERR-299)",
+     ["build", "compile", "linker", "cmake", "dependency", "header", "symbol", "toolchain", "flag", "cache"]),
+    ("hardware", "FPGA/Hardware (ERR-300~ERR-399)",
+     ["fpga", "port", "signal", "reset", "clock", "timing", "verilog", "synthesis", "constraint", "latch"]),
+    ("backend", "Backend/API (ERR-400~ERR-499)",
+     ["api", "endpoint", "database", "query", "timeout", "auth", "token", "schema", "migration", "request"]),
+    ("frontend", "Frontend/UI (ERR-500~ERR-599)",
+     ["ui", "component", "render", "state", "css", "layout", "event", "router", "bundle", "hydration"]),
+    ("win32", "MFC/Win32 (ERR-600~ERR-699)",
+     ["mfc", "win32", "dialog", "message", "handle", "resource", "registry", "dll", "unicode", "thread"]),
+]
+
+IDS_PER_BLOCK = 99
+
+PROBLEM_TEMPLATES = [
+    "`{a} {b} failed` while running the {c} step",
+    "Unexpected {a} error after changing the {b} {c}",
+    "{a} {b} not found when the {c} is missing",
+]
+CAUSE_TEMPLATES = [
+    "The {a} {b} was assumed instead of verified",
+    "Stale {a} state left over from a previous {b} {c}",
+    "Wrong {a} ordering between {b} and {c}",
+]
+SOLUTION_TEMPLATES = [
+    "Check the {a} {b} first, then retry the {c}",
+    "Reset the {a} and rebuild the {b} {c}",
+    "Use the documented {a} {b} workflow for {c}",
+]
+PREVENTION_TEMPLATES = [
+    "Always verify the {a} {b} before each {c}",
+    "Add a {a} check to the {b} {c} checklist",
+    "Document the {a} {b} requirements for {c}",
+]
+
+
+def rule_number(index: int) -> int:
+    """ERR number of the index-th generated rule (0-based)."""
+    category = index % len(CATEGORIES)
+    slot = index // len(CATEGORIES)
+    block, offset = divmod(slot, IDS_PER_BLOCK)
+    return block * 1000 + category * 100 + offset + 1
+
+
+def make_rule(index: int, rng: random.Random) -> dict:
+    """Build the fields of one synthetic rule."""
+    number = rule_number(index)
+    _name, label, vocabulary = CATEGORIES[index % len(CATEGORIES)]
+
+    def sentence(templates: list[str]) -> str:
+        a, b, c = rng.sample(vocabulary, 3)
+        return rng.choice(templates).format(a=a, b=b, c=c)
+
+    a, b = rng.sample(vocabulary, 2)
+    return {
+        "id": f"ERR-{number:03d}",
+        "title": f"{a.capitalize()} {b} failure {number}",
+        "problem": sentence(PROBLEM_TEMPLATES),
+        "root_cause": sentence(CAUSE_TEMPLATES),
+        "solution": sentence(SOLUTION_TEMPLATES),
+        "prevention": sentence(PREVENTION_TEMPLATES),
+        "date": f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        "category": label,
+    }
+
+
+def generate_rules(rule_count: int, seed: int = 0) -> list[dict]:
+    """Generate the rule dictionaries for a corpus."""
+    rng = random.Random(seed)
+    return [make_rule(index, rng) for index in range(rule_count)]
+
+
+def generate_memory(rule_count: int, seed: int = 0) -> str:
+    """Generate a memory.md document with rule_count rules.
+
+    Args:
+        rule_count: Number of ERR rules
+        seed: Random seed for the rule text
+
+    Returns:
+        The memory.md content
+    """
+    rules = generate_rules(rule_count, seed)
+
+    parts = [
+        "# Global Development Memory - MANDATORY RULES",
+        "",
+        "**Last Updated**: 2026-02-06",
+        "",
+        "## 4. Common Errors Across All Projects (Claude Code Working)",
+        "",
+    ]
+    for rule in rules:
+        parts.extend([
+            f"### {rule['id']}: {rule['title']}",
+            f"**Problem**: {rule['problem']}",
+            f"**Root Cause**: {rule['root_cause']}",
+            f"**Solution**: {rule['solution']}",
+            f"**Prevention**: {rule['prevention']}",
+            f"**Date**: {rule['date']}",
+            f"**Category**: {rule['category']}",
+            "",
+        ])
+
+    parts.extend([
+        "## 5. Quick Reference",
+        "",
+        "### Error Quick Reference Table",
+        "",
+        "| Error ID | Description | Quick Solution |",
+        "|----------|-------------|----------------|",
+    ])
+    parts.extend(f"| {rule['id']} | {rule['title']} | {rule['solution']} |" for rule in rules)
+    parts.append("")
+
+    return "\n".join(parts)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Generate a synthetic memory.md rule corpus")
+    parser.add_argument(
+        "rules",
+        type=int,
+        help="Number of rules to generate"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Random seed for the rule text (default: 0)"
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        help="Output file (default: stdout)"
+    )
+    args = parser.parse_args()
+
+    content = generate_memory(args.rules, args.seed)
+    if args.output:
+        Path(args.output).write_text(content, encoding="utf-8")
+    else:
+        sys.stdout.write(content)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -28,6 +28,10 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
+# Import shared rule parser
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from shared.rule_parser import iter_rules
+
 
 # ANSI color codes for terminal output
 class Colors:
@@ -264,6 +268,8 @@ def find_insert_position(content: str, err_num: int) -> int:
     """Find the appropriate position to insert a new rule.
 
     Rules should be inserted in numerical order within their category section.
+    Line offsets are tracked while scanning and rule offsets come from the
+    shared parser, so the whole lookup is a single linear pass.
 
     Args:
         content: The memory.md file content
@@ -272,35 +278,34 @@ def find_insert_position(content: str, err_num: int) -> int:
     Returns:
         Character position where the new rule should be inserted
     """
-    lines = content.split("\n")
-
     # Find the appropriate section based on ERR number
     if err_num < 100:
         section_start = None
-        for i, line in enumerate(lines):
-            if "## 4. Common Errors Across All Projects" in line or \
-               ("ERR-001:" in line and section_start is None):
-                if section_start is None:
-                    section_start = i
-            elif section_start is not None:
-                # Found a rule, check if we should insert before it
-                match = re.search(r'ERR-(\d+):', line)
-                if match and int(match.group(1)) > err_num:
-                    # Insert before this rule
-                    return sum(len(l) + 1 for l in lines[:i])
-
-        # Insert at the end of the section
+        section_end = None
+        offset = 0
+        for line in content.split("\n"):
+            if section_start is None:
+                if "## 4. Common Errors Across All Projects" in line or "ERR-001:" in line:
+                    section_start = offset
+            elif line.startswith("## ") and "Common Errors" not in line:
+                section_end = offset
+                break
+            offset += len(line) + 1
+
         if section_start is not None:
-            # Find the end of this section
-            for i in range(section_start, len(lines)):
-                if lines[i].startswith("## ") and "Common Errors" not in lines[i]:
-                    return sum(len(l) + 1 for l in lines[:i])
+            # Insert before the first later rule with a higher number
+            for rule in iter_rules(content):
+                if rule['offset'] > section_start and int(rule['id'][4:]) > err_num:
+                    return rule['offset']
+
+            # Insert at the end of the section
+            if section_end is not None:
+                return section_end
 
     # For other categories, insert before the Quick Reference table
-    for i, line in enumerate(lines):
-        if "### Error Quick Reference Table" in line or \
-           "Error Quick Reference Table" in line:
-            return sum(len(l) + 1 for l in lines[:i])
+    table_pos = content.find("Error Quick Reference Table")
+    if table_pos != -1:
+        return content.rfind("\n", 0, table_pos) + 1
 
     # Default: append to end
     return len(content)
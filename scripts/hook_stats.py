@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Global Claude Rules - Hook Latency Report
+
+Aggregates recorded hook timings (written when GLOBAL_CLAUDE_HOOK_TIMING=log,
+see shared/hook_timing.py) into p50/p95/p99 latency per hook, tool_name and
+phase. Logs collected from several machines can be passed together.
+
+Each record contributes:
+- "total": the whole hook run
+- one row per entry in "phases" (e.g. stdin_read, config_load)
+- one "collector.<name>" row per SessionStart collector
+
+Usage:
+    python scripts/hook_stats.py
+    python scripts/hook_stats.py --log laptop.jsonl --log desktop.jsonl
+    python scripts/hook_stats.py --format csv --output hook_stats.csv
+    python scripts/hook_stats.py --save-baseline baseline.json
+    python scripts/hook_stats.py --baseline baseline.json --threshold 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import json
+import sys
+from pathlib import Path
+
+# Import shared timing log reader
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from shared.hook_timing import TIMING_LOG_FILE, read_timing_records
+
+
+# ANSI color codes
+class Colors:
+    """ANSI color codes for terminal output."""
+    OKGREEN = '\033[92m'
+    WARNING = '\033[93m'
+    FAIL = '\033[91m'
+    ENDC = '\033[0m'
+
+    @staticmethod
+    def disable():
+        """Disable colors."""
+        Colors.OKGREEN = ''
+        Colors.WARNING = ''
+        Colors.FAIL = ''
+        Colors.ENDC = ''
+
+
+def setup_colors():
+    """Setup colors based on platform."""
+    if sys.platform == "win32":
+        try:
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetConsoleMode(kernel32.GetStdHandle(-11), 7)
+        except (AttributeError, OSError):
+            Colors.disable()
+
+
+# Status messages go to stderr so CSV/JSON reports on stdout stay parseable
+def print_success(text: str):
+    """Print success message."""
+    print(f"{Colors.OKGREEN}✓ {text}{Colors.ENDC}", file=sys.stderr)
+
+
+def print_error(text: str):
+    """Print error message."""
+    print(f"{Colors.FAIL}✗ {text}{Colors.ENDC}", file=sys.stderr)
+
+
+def print_warning(text: str):
+    """Print warning message."""
+    print(f"{Colors.WARNING}⚠ {text}{Colors.ENDC}", file=sys.stderr)
+
+
+PERCENTILES = (50, 95, 99)
+STAT_FIELDS = ["hook", "tool_name", "phase", "count", "p50", "p95", "p99", "max"]
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Percentile with linear interpolation between closest ranks.
+
+    Args:
+        sorted_values: Non-empty list sorted ascending
+        q: Percentile in [0, 100]
+    """
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    position = (len(sorted_values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def iter_samples(record: dict):
+    """Yield (hook, tool_name, phase, ms) samples from one timing record."""
+    hook = record.get("hook") or "unknown"
+    tool_name = record.get("tool_name") or "-"
+
+    if isinstance(record.get("total_ms"), (int, float)):
+        yield hook, tool_name, "total", float(record["total_ms"])
+    for phase, ms in (record.get("phases") or {}).items():
+        if isinstance(ms, (int, float)):
+            yield hook, tool_name, phase, float(ms)
+    for name, ms in (record.get("collectors") or {}).items():
+        # None: the collector was still pending when the hook answered
+        if isinstance(ms, (int, float)):
+            yield hook, tool_name, f"collector.{name}", float(ms)
+
+
+def aggregate(records: list[dict]) -> list[dict]:
+    """Aggregate timing records into percentile rows.
+
+    Returns:
+        Rows with STAT_FIELDS keys, sorted by hook, tool_name and phase
+    """
+    samples: dict[tuple[str, str, str], list[float]] = {}
+    for record in records:
+        for hook, tool_name, phase, ms in iter_samples(record):
+            samples.setdefault((hook, tool_name, phase), []).append(ms)
+
+    rows = []
+    for (hook, tool_name, phase), values in sorted(samples.items()):
+        values.sort()
+        row = {"hook": hook, "tool_name": tool_name, "phase": phase, "count": len(values)}
+        for q in PERCENTILES:
+            row[f"p{q}"] = round(percentile(values, q), 2)
+        row["max"] = round(values[-1], 2)
+        rows.append(row)
+    return rows
+
+
+def row_key(row: dict) -> str:
+    """Baseline key for a row."""
+    return f"{row['hook']}|{row['tool_name']}|{row['phase']}"
+
+
+def build_baseline(rows: list[dict]) -> dict:
+    """Convert aggregated rows into a baseline document."""
+    return {
+        "version": 1,
+        "stats": {
+            row_key(row): {field: row[field] for field in ("count", "p50", "p95", "p99")}
+            for row in rows
+        },
+    }
+
+
+def find_regressions(
+    rows: list[dict],
+    baseline: dict,
+    threshold: float = 0.2,
+    min_delta_ms: float = 5.0,
+    metric: str = "p95",
+) -> list[dict]:
+    """Compare rows against a baseline.
+
+    A row regresses when its metric exceeds the baseline by more than
+    ``threshold`` (relative) and by at least ``min_delta_ms``, so noise on
+    sub-millisecond phases is not reported.
+
+    Returns:
+        List of {key, metric, baseline, current, change} dictionaries
+    """
+    baseline_stats = baseline.get("stats", {})
+    regressions = []
+    for row in rows:
+        previous = baseline_stats.get(row_key(row))
+        if not previous or metric not in previous:
+            continue
+        old, new = float(previous[metric]), float(row[metric])
+        if new - old >= min_delta_ms and new > old * (1 + threshold):
+            regressions.append({
+                "key": row_key(row),
+                "metric": metric,
+                "baseline": old,
+                "current": new,
+                "change": round((new - old) / old, 3) if old else None,
+            })
+    return regressions
+
+
+def format_table(rows: list[dict]) -> str:
+    """Format rows as an aligned text table."""
+    headers = ["hook", "tool_name", "phase", "count", "p50 ms", "p95 ms", "p99 ms", "max ms"]
+    lines = [
+        [row["hook"], row["tool_name"], row["phase"], str(row["count"]),
+         f"{row['p50']:.1f}", f"{row['p95']:.1f}", f"{row['p99']:.1f}", f"{row['max']:.1f}"]
+        for row in rows
+    ]
+    widths = [max(len(header), *(len(line[i]) for line in lines)) for i, header in enumerate(headers)]
+
+    def render(cells: list[str]) -> str:
+        text_cells = [cell.ljust(width) for cell, width in zip(cells[:3], widths[:3])]
+        number_cells = [cell.rjust(width) for cell, width in zip(cells[3:], widths[3:])]
+        return "  ".join(text_cells + number_cells)
+
+    output = [render(headers), render(["-" * width for width in widths])]
+    output.extend(render(line) for line in lines)
+    return "\n".join(output)
+
+
+def format_csv(rows: list[dict]) -> str:
+    """Format rows as CSV."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=STAT_FIELDS, lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+def format_json(rows: list[dict], regressions: list[dict] | None = None) -> str:
+    """Format rows (and regressions, if compared) as JSON."""
+    document: dict = {"stats": rows}
+    if regressions is not None:
+        document["regressions"] = regressions
+    return json.dumps(document, ensure_ascii=False, indent=2) + "\n"
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Report hook latency percentiles from recorded timing logs",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Exit codes:
+  0: Report written (no regressions)
+  1: Regressions found against the baseline
+  2: No timing records or unreadable baseline
+        """
+    )
+    parser.add_argument(
+        "--log",
+        action="append",
+        help=f"Timing log file; repeat for several machines (default: {TIMING_LOG_FILE} and its rotations)"
+    )
+    parser.add_argument(
+        "--hook",
+        help="Only report this hook (e.g. SessionStart, PreToolUse)"
+    )
+    parser.add_argument(
+        "--format",
+        choices=["table", "csv", "json"],
+        default="table",
+        help="Output format (default: table)"
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        help="Write the report to a file instead of stdout"
+    )
+    parser.add_argument(
+        "--baseline",
+        help="Baseline JSON to flag regressions against"
+    )
+    parser.add_argument(
+        "--save-baseline",
+        help="Write the current percentiles as a baseline JSON"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Relative p95 increase that counts as a regression (default: 0.2)"
+    )
+    parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=5.0,
+        help="Ignore p95 increases smaller than this (default: 5.0)"
+    )
+
+    args = parser.parse_args()
+
+    setup_colors()
+
+    log_paths = [Path(path) for path in args.log] if args.log else [None]
+    records = []
+    for log_path in log_paths:
+        records.extend(read_timing_records(log_path))
+    if args.hook:
+        records = [record for record in records if record.get("hook") == args.hook]
+
+    if not records:
+        print_error("No timing records found (enable with GLOBAL_CLAUDE_HOOK_TIMING=log)")
+        return 2
+
+    rows = aggregate(records)
+
+    regressions = None
+    if args.baseline:
+        try:
+            baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            print_error(f"Failed to read baseline: {e}")
+            return 2
+        regressions = find_regressions(rows, baseline, args.threshold, args.min_delta_ms)
+
+    if args.format == "csv":
+        report = format_csv(rows)
+    elif args.format == "json":
+        report = format_json(rows, regressions)
+    else:
+        report = format_table(rows) + "\n"
+
+    if args.output:
+        Path(args.output).write_text(report, encoding="utf-8")
+        print_success(f"Wrote {len(rows)} rows from {len(records)} records to {args.output}")
+    else:
+        sys.stdout.write(report)
+
+    if args.save_baseline:
+        Path(args.save_baseline).write_text(
+            json.dumps(build_baseline(rows), ensure_ascii=False, indent=2) + "\n",
+            encoding="utf-8"
+        )
+        print_success(f"Saved baseline: {args.save_baseline}")
+
+    if regressions:
+        for regression in regressions:
+            change = f"+{regression['change']:.0%}" if regression["change"] is not None else "new"
+            print_warning(
+                f"Regression {regression['key']}: {regression['metric']} "
+                f"{regression['baseline']:.1f} -> {regression['current']:.1f} ms ({change})"
+            )
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -23,6 +23,14 @@ $ScriptDir = Join-Path $ScriptDir ""
 $ClaudeDir = Join-Path $env:USERPROFILE ".claude"
 $HooksDir = Join-Path $ClaudeDir "hooks\moai"
 
+# Shared modules copied next to the hooks (keep in sync with HOOK_LIB_FILES in install.py)
+$HookLibFiles = @(
+    "rule_parser.py",
+    "rule_snapshot.py",
+    "git_metadata.py",
+    "hook_timing.py"
+)
+
 # Template variables
 $CurrentDate = Get-Date -Format "yyyy-MM-dd"
 $Version = "1.4"
@@ -159,6 +167,33 @@ function Install-HookFile {
     return $true
 }
 
+function Install-HookLibs {
+    # Library files always track the installed hook version, so they are
+    # overwritten without prompting
+    $libDir = Join-Path $HooksDir "lib"
+
+    foreach ($fileName in $HookLibFiles) {
+        $sourceFile = Join-Path $ScriptDir "shared\$fileName"
+        $targetFile = Join-Path $libDir $fileName
+
+        if (-not (Test-Path $sourceFile)) {
+            Print-Error "Source file not found: $sourceFile"
+            return $false
+        }
+
+        if ($DryRun) {
+            Print-Info "[DRY RUN] Would copy: $sourceFile -> $targetFile"
+            continue
+        }
+
+        New-Item -ItemType Directory -Path $libDir -Force | Out-Null
+        Copy-Item -Path $sourceFile -Destination $targetFile -Force
+        Print-Success "Installed: $targetFile"
+    }
+
+    return $true
+}
+
 function Install-GuideFile {
     $sourceFile = Join-Path $ScriptDir "templates\GLOBAL_RULES_GUIDE.md"
     $targetFile = Join-Path $ClaudeDir "GLOBAL_RULES_GUIDE.md"
@@ -207,6 +242,7 @@ function Print-Summary {
     Write-Host "  Memory File:       $(Join-Path $ClaudeDir 'memory.md')"
     Write-Host "  Guide File:        $(Join-Path $ClaudeDir 'GLOBAL_RULES_GUIDE.md')"
     Write-Host "  Hook File:         $(Join-Path $HooksDir 'session_start__show_project_info.py')"
+    Write-Host "  Hook Libs:         $(Join-Path $HooksDir 'lib')"
     Write-Host ""
 
     # Verify installation
@@ -265,6 +301,7 @@ if ($DryRun) {
 $success = $true
 $success = $success -and (Install-MemoryMd)
 $success = $success -and (Install-HookFile)
+$success = $success -and (Install-HookLibs)
 $success = $success -and (Install-GuideFile)
 
 # Print summary
@@ -73,6 +73,15 @@ def print_info(text: str):
     print(f"{Colors.OKCYAN}ℹ {text}{Colors.ENDC}")
 
 
+# Shared modules copied next to the hooks (importable as lib.<module>)
+HOOK_LIB_FILES = [
+    "rule_parser.py",
+    "rule_snapshot.py",
+    "git_metadata.py",
+    "hook_timing.py",
+]
+
+
 def get_script_dir() -> Path:
     """Get the directory where this script is located."""
     return Path(__file__).parent.parent.resolve()
@@ -216,6 +225,37 @@ def install_hook_file(
     return True
 
 
+def install_hook_libs(
+    source_dir: Path,
+    hooks_dir: Path,
+    dry_run: bool = False,
+) -> bool:
+    """Install shared library modules used by the hooks.
+
+    Library files always track the installed hook version, so they are
+    overwritten without prompting.
+    """
+    lib_dir = hooks_dir / "lib"
+
+    for filename in HOOK_LIB_FILES:
+        source_file = source_dir / "shared" / filename
+        target_file = lib_dir / filename
+
+        if not source_file.exists():
+            print_error(f"Source file not found: {source_file}")
+            return False
+
+        if dry_run:
+            print_info(f"[DRY RUN] Would copy: {source_file} -> {target_file}")
+            continue
+
+        lib_dir.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(source_file, target_file)
+        print_success(f"Installed: {target_file}")
+
+    return True
+
+
 def install_guide_file(
     source_dir: Path,
     claude_dir: Path,
@@ -435,6 +475,7 @@ Examples:
     success = True
     success &= install_memory_md(script_dir, claude_dir, variables, args.dry_run, args.force)
     success &= install_hook_file(script_dir, hooks_dir, args.dry_run, args.force)
+    success &= install_hook_libs(script_dir, hooks_dir, args.dry_run)
     success &= install_guide_file(script_dir, claude_dir, variables, args.dry_run, args.force)
 
     # Install hooks directory (optional - for projects that need full tooling)
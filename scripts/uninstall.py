@@ -57,6 +57,15 @@ def get_claude_dir() -> Path:
     return Path.home() / ".claude"
 
 
+# Shared modules installed into the hooks lib directory (see install.py)
+HOOK_LIB_FILES = [
+    "rule_parser.py",
+    "rule_snapshot.py",
+    "git_metadata.py",
+    "hook_timing.py",
+]
+
+
 def get_hooks_dir() -> Path:
     """Get the hooks directory."""
     return get_claude_dir() / "hooks" / "moai"
@@ -156,6 +165,7 @@ Examples:
     memory_file = claude_dir / "memory.md"
     hook_file = hooks_dir / "session_start__show_project_info.py"
     guide_file = claude_dir / "GLOBAL_RULES_GUIDE.md"
+    lib_files = [hooks_dir / "lib" / name for name in HOOK_LIB_FILES]
 
     # Show what will be removed
     print_warning("The following files will be removed:")
@@ -163,6 +173,9 @@ Examples:
         print(f"  - {memory_file}")
     if hook_file.exists():
         print(f"  - {hook_file}")
+    for lib_file in lib_files:
+        if lib_file.exists():
+            print(f"  - {lib_file}")
     if guide_file.exists():
         print(f"  - {guide_file}")
     print()
@@ -192,6 +205,10 @@ Examples:
     else:
         print_info(f"Not found: {hook_file}")
 
+    for lib_file in lib_files:
+        if lib_file.exists():
+            success &= remove_file(lib_file, args.dry_run)
+
     if guide_file.exists():
         # Ask about guide file separately
         if not args.yes and not args.dry_run:
@@ -206,6 +223,7 @@ Examples:
 
     # Clean up empty directories
     if not args.dry_run:
+        remove_directory(hooks_dir / "lib")
         remove_directory(hooks_dir)
         remove_directory(claude_dir / "hooks")
 
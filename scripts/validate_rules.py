@@ -25,6 +25,10 @@ from datetime import datetime
 from pathlib import Path
 from typing import NamedTuple
 
+# Import shared rule parser
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from shared.rule_parser import parse_rules
+
 
 # ANSI color codes
 class Colors:
@@ -186,22 +190,16 @@ def parse_err_rule(content: str, start_idx: int) -> tuple[dict, int]:
 def find_all_rules(content: str) -> list[dict]:
     """Find all ERR rules in the content.
 
+    Uses the shared single-pass parser, so the cost is linear in file size.
+    Each rule also carries ``offset``/``byte_offset`` and ``end_line`` fields.
+
     Args:
         content: The file content
 
     Returns:
         List of rule dictionaries
     """
-    rules = []
-    lines = content.split("\n")
-
-    for i, line in enumerate(lines):
-        if re.match(r'###\s+ERR-\d+:', line):
-            rule, _ = parse_err_rule(content, i)
-            if rule['id']:
-                rules.append(rule)
-
-    return rules
+    return parse_rules(content)
 
 
 def validate_date(date_str: str) -> bool:
@@ -260,18 +258,21 @@ def validate_category_range(err_id: str, category: str) -> bool:
     return True
 
 
-def validate_rules(content: str, verbose: bool = False) -> ValidationResult:
+def validate_rules(content: str, verbose: bool = False,
+                   rules: list[dict] | None = None) -> ValidationResult:
     """Validate all ERR rules in the content.
 
     Args:
         content: The file content
         verbose: Enable verbose output
+        rules: Already parsed rules (parsed from content if omitted)
 
     Returns:
         ValidationResult with all issues found
     """
     result = ValidationResult()
-    rules = find_all_rules(content)
+    if rules is None:
+        rules = find_all_rules(content)
     result.rules_found = [r['id'] for r in rules]
 
     if verbose:
@@ -470,11 +471,10 @@ Exit codes:
     if args.verbose and not args.quiet:
         print_info(f"Validating: {file_path}")
 
-    # Validate rules
-    result = validate_rules(content, args.verbose)
-
-    # Also validate quick reference table
+    # Parse once, then validate rules and the quick reference table
     rules = find_all_rules(content)
+    result = validate_rules(content, args.verbose, rules=rules)
+
     table_result = validate_quick_reference_table(content, rules)
     result.warnings.extend(table_result.warnings)
 
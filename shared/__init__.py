@@ -11,6 +11,10 @@ from .errors import (
     ConfigurationError,
     NetworkError,
 )
+from .rule_parser import iter_rules, parse_rules
+from .rule_snapshot import compile_snapshot, load_rule_snapshot, load_snapshot_rules
+from .git_metadata import read_git_metadata
+from .hook_timing import PhaseTimer, read_timing_records
 
 __all__ = [
     "GlobalRulesError",
@@ -19,4 +23,12 @@ __all__ = [
     "ValidationError",
     "ConfigurationError",
     "NetworkError",
+    "iter_rules",
+    "parse_rules",
+    "compile_snapshot",
+    "load_rule_snapshot",
+    "load_snapshot_rules",
+    "read_git_metadata",
+    "PhaseTimer",
+    "read_timing_records",
 ]
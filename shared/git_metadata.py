@@ -0,0 +1,479 @@
+#!/usr/bin/env python3
+"""
+Read-Only Git Metadata Reader for Global Claude Rules
+
+Reads branch name, HEAD commit and the last commit's subject and author
+time straight from the ``.git`` directory, so the SessionStart hook does
+not have to spawn git for them (process creation is slow on Windows).
+
+Supported:
+- ``.git`` directories and ``.git`` files pointing to a gitdir (worktrees,
+  submodules) including ``commondir``
+- Loose refs, ``packed-refs`` and symbolic refs
+- Loose objects and pack files (v2 index, OFS/REF deltas)
+
+``short_commit`` follows git's ``%h``: ``core.abbrev`` from the user and
+repository config, otherwise git's automatic length derived from the
+number of packed objects (at least 7). Unlike git it does not lengthen the
+abbreviation further when the prefix is ambiguous, and the system config
+and ``include`` directives are not read.
+
+Anything else (reftable, SHA-256 repositories, alternates, corrupt data,
+refs that are neither a 40-hex sha nor a symbolic ref) makes
+read_git_metadata() return None so callers can fall back to git.
+
+Like rule_parser.py, this module is stdlib-only so it can be copied next
+to the hooks (``hooks/moai/lib/``).
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import re
+import struct
+import time
+import zlib
+from pathlib import Path
+
+SHA_RE = re.compile(r"[0-9a-f]{40}")
+
+# Pack object types
+OBJ_COMMIT = 1
+OBJ_OFS_DELTA = 6
+OBJ_REF_DELTA = 7
+
+# Abbreviated sha lengths (git's FALLBACK_DEFAULT_ABBREV and minimum_abbrev)
+DEFAULT_ABBREV = 7
+MIN_ABBREV = 4
+
+MAX_SYMREF_DEPTH = 5
+MAX_DELTA_DEPTH = 64
+INFLATE_CHUNK = 64 * 1024
+
+
+def find_git_dir(start: Path) -> Path | None:
+    """Find the git directory for ``start`` or its closest parent.
+
+    Args:
+        start: Directory to search from
+
+    Returns:
+        Path to the git directory, or None if not inside a repository
+    """
+    for parent in [start] + list(start.parents):
+        dot_git = parent / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.is_file():
+            try:
+                content = dot_git.read_text(encoding="utf-8").strip()
+            except (OSError, UnicodeDecodeError):
+                return None
+            if not content.startswith("gitdir:"):
+                return None
+            git_dir = Path(content[len("gitdir:"):].strip())
+            if not git_dir.is_absolute():
+                git_dir = parent / git_dir
+            return git_dir if git_dir.is_dir() else None
+    return None
+
+
+def _get_common_dir(git_dir: Path) -> Path:
+    """Get the directory holding shared refs and objects (worktree aware)."""
+    commondir_file = git_dir / "commondir"
+    try:
+        common = Path(commondir_file.read_text(encoding="utf-8").strip())
+    except (OSError, UnicodeDecodeError):
+        return git_dir
+    return common if common.is_absolute() else (git_dir / common).resolve()
+
+
+def _read_git_config(paths: list[Path]) -> dict[str, str]:
+    """Read ``section.key`` values from git config files, later files winning.
+
+    Only plain ``key = value`` lines are understood; includes and
+    multi-line values are ignored.
+    """
+    values = {}
+    for path in paths:
+        try:
+            content = path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            continue
+        section = ""
+        for line in content.splitlines():
+            line = line.strip()
+            if not line or line[0] in "#;":
+                continue
+            if line.startswith("["):
+                name, _, subsection = line[1:].partition("]")[0].partition(" ")
+                section = name.strip().lower()
+                if subsection:
+                    section += "." + subsection.strip().strip('"')
+                continue
+            key, separator, value = line.partition("=")
+            value = re.split(r"\s[#;]", value, maxsplit=1)[0].strip().strip('"') if separator else "true"
+            values[f"{section}.{key.strip().lower()}"] = value
+    return values
+
+
+def _config_files(common_dir: Path) -> list[Path]:
+    """Global and repository git config files, lowest precedence first."""
+    global_config = os.getenv("GIT_CONFIG_GLOBAL")
+    if global_config:
+        files = [Path(global_config)]
+    else:
+        xdg_home = os.getenv("XDG_CONFIG_HOME")
+        xdg_dir = Path(xdg_home) if xdg_home else Path.home() / ".config"
+        files = [xdg_dir / "git" / "config", Path.home() / ".gitconfig"]
+    files.append(common_dir / "config")
+    return files
+
+
+def _count_packed_objects(objects_dir: Path) -> int:
+    """Sum the object counts of all pack indexes (git's approximate count)."""
+    count = 0
+    for idx_path in (objects_dir / "pack").glob("*.idx"):
+        try:
+            with open(idx_path, "rb") as f:
+                header = f.read(8 + 256 * 4)
+        except OSError:
+            continue
+        fanout = 8 if header[:8] == b"\xfftOc\x00\x00\x00\x02" else 0
+        if len(header) >= fanout + 256 * 4:
+            count += struct.unpack_from(">I", header, fanout + 255 * 4)[0]
+    return count
+
+
+def abbrev_length(config: dict[str, str], objects_dir: Path) -> int:
+    """Length of an abbreviated sha, following git's ``core.abbrev`` rules.
+
+    Args:
+        config: Values from _read_git_config
+        objects_dir: Objects directory used for the automatic length
+
+    Returns:
+        Number of hex digits (40 when abbreviation is disabled)
+    """
+    value = config.get("core.abbrev", "auto").lower()
+    if value in ("false", "no", "off"):
+        return 40
+    if value != "auto":
+        try:
+            return min(max(int(value), MIN_ABBREV), 40)
+        except ValueError:
+            pass
+    # About 2^bits objects expect a collision at 2^(bits/2); 4 bits per hex digit
+    bits = _count_packed_objects(objects_dir).bit_length()
+    return max(DEFAULT_ABBREV, (bits + 1) // 2)
+
+
+def _read_packed_refs(common_dir: Path) -> dict[str, str]:
+    """Parse ``packed-refs`` into a ref -> sha mapping."""
+    refs = {}
+    try:
+        content = (common_dir / "packed-refs").read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return refs
+    for line in content.splitlines():
+        if not line or line[0] in "#^":
+            continue
+        sha, _, ref = line.partition(" ")
+        refs[ref.strip()] = sha
+    return refs
+
+
+def _resolve_ref(git_dir: Path, common_dir: Path, ref: str, depth: int = 0) -> str | None:
+    """Resolve a ref name to a commit sha, following symbolic refs.
+
+    Returns:
+        The sha, "" when the ref does not exist (unborn branch), or None
+        when the ref value cannot be interpreted (e.g. a SHA-256 object id)
+    """
+    if depth > MAX_SYMREF_DEPTH:
+        return None
+    for base in (git_dir, common_dir):
+        try:
+            value = (base / ref).read_text(encoding="utf-8").strip()
+        except FileNotFoundError:
+            continue
+        except (OSError, UnicodeDecodeError):
+            return None
+        if value.startswith("ref:"):
+            return _resolve_ref(git_dir, common_dir, value[4:].strip(), depth + 1)
+        return value if SHA_RE.fullmatch(value) else None
+    value = _read_packed_refs(common_dir).get(ref)
+    if value is None:
+        return ""
+    return value if SHA_RE.fullmatch(value) else None
+
+
+def _inflate(buffer, pos: int) -> bytes:
+    """Decompress a zlib stream starting at ``pos`` of a bytes-like buffer."""
+    decompressor = zlib.decompressobj()
+    chunks = []
+    while not decompressor.eof:
+        chunk = buffer[pos:pos + INFLATE_CHUNK]
+        if not chunk:
+            raise ValueError("Truncated zlib stream")
+        chunks.append(decompressor.decompress(chunk))
+        pos += len(chunk)
+    return b"".join(chunks)
+
+
+def _apply_delta(base: bytes, delta: bytes) -> bytes:
+    """Apply a git pack delta to its base object."""
+    pos = 0
+    # Skip source and target size varints
+    for _ in range(2):
+        while delta[pos] & 0x80:
+            pos += 1
+        pos += 1
+
+    out = bytearray()
+    while pos < len(delta):
+        opcode = delta[pos]
+        pos += 1
+        if opcode & 0x80:
+            copy_offset = 0
+            copy_size = 0
+            for i in range(4):
+                if opcode & (1 << i):
+                    copy_offset |= delta[pos] << (8 * i)
+                    pos += 1
+            for i in range(3):
+                if opcode & (0x10 << i):
+                    copy_size |= delta[pos] << (8 * i)
+                    pos += 1
+            out += base[copy_offset:copy_offset + (copy_size or 0x10000)]
+        elif opcode:
+            out += delta[pos:pos + opcode]
+            pos += opcode
+        else:
+            raise ValueError("Invalid delta opcode")
+    return bytes(out)
+
+
+class _PackReader:
+    """Looks up objects in the pack files of one objects directory."""
+
+    def __init__(self, objects_dir: Path):
+        self.objects_dir = objects_dir
+        self._packs: list[tuple[mmap.mmap, mmap.mmap]] | None = None
+
+    def _load_packs(self) -> list[tuple[mmap.mmap, mmap.mmap]]:
+        if self._packs is None:
+            self._packs = []
+            for idx_path in sorted((self.objects_dir / "pack").glob("*.idx")):
+                try:
+                    with open(idx_path, "rb") as idx_file, open(idx_path.with_suffix(".pack"), "rb") as pack_file:
+                        idx = mmap.mmap(idx_file.fileno(), 0, access=mmap.ACCESS_READ)
+                        pack = mmap.mmap(pack_file.fileno(), 0, access=mmap.ACCESS_READ)
+                except (OSError, ValueError):
+                    continue
+                if idx[:8] == b"\xfftOc\x00\x00\x00\x02":
+                    self._packs.append((idx, pack))
+        return self._packs
+
+    def find(self, sha: bytes) -> tuple[mmap.mmap, int] | None:
+        """Find (pack, offset) for a binary sha."""
+        for idx, pack in self._load_packs():
+            fanout = 8
+            count = struct.unpack_from(">I", idx, fanout + 255 * 4)[0]
+            lo = struct.unpack_from(">I", idx, fanout + (sha[0] - 1) * 4)[0] if sha[0] else 0
+            hi = struct.unpack_from(">I", idx, fanout + sha[0] * 4)[0]
+            names = fanout + 256 * 4
+            while lo < hi:
+                mid = (lo + hi) // 2
+                name = idx[names + mid * 20:names + mid * 20 + 20]
+                if name < sha:
+                    lo = mid + 1
+                elif name > sha:
+                    hi = mid
+                else:
+                    offsets = names + count * 24
+                    offset = struct.unpack_from(">I", idx, offsets + mid * 4)[0]
+                    if offset & 0x80000000:
+                        large = offsets + count * 4 + (offset & 0x7FFFFFFF) * 8
+                        offset = struct.unpack_from(">Q", idx, large)[0]
+                    return pack, offset
+        return None
+
+    def read_at(self, pack: mmap.mmap, offset: int, depth: int = 0) -> tuple[int, bytes]:
+        """Read and undeltify the object at ``offset`` of ``pack``."""
+        if depth > MAX_DELTA_DEPTH:
+            raise ValueError("Delta chain too deep")
+
+        byte = pack[offset]
+        obj_type = (byte >> 4) & 7
+        pos = offset + 1
+        while byte & 0x80:
+            byte = pack[pos]
+            pos += 1
+
+        if obj_type == OBJ_OFS_DELTA:
+            byte = pack[pos]
+            pos += 1
+            base_distance = byte & 0x7F
+            while byte & 0x80:
+                byte = pack[pos]
+                pos += 1
+                base_distance = ((base_distance + 1) << 7) | (byte & 0x7F)
+            base_type, base = self.read_at(pack, offset - base_distance, depth + 1)
+            return base_type, _apply_delta(base, _inflate(pack, pos))
+
+        if obj_type == OBJ_REF_DELTA:
+            base_sha = bytes(pack[pos:pos + 20])
+            location = self.find(base_sha)
+            if location is None:
+                raise ValueError("Delta base not found")
+            base_type, base = self.read_at(*location, depth=depth + 1)
+            return base_type, _apply_delta(base, _inflate(pack, pos + 20))
+
+        return obj_type, _inflate(pack, pos)
+
+
+def read_commit_object(common_dir: Path, sha: str) -> bytes | None:
+    """Read the raw body of a commit object (loose or packed).
+
+    Args:
+        common_dir: Git common directory
+        sha: Hex commit sha
+
+    Returns:
+        Commit body bytes, or None if the object cannot be read
+    """
+    objects_dir = common_dir / "objects"
+    loose_path = objects_dir / sha[:2] / sha[2:]
+    try:
+        raw = zlib.decompress(loose_path.read_bytes())
+    except FileNotFoundError:
+        pass
+    except (OSError, zlib.error):
+        return None
+    else:
+        header, _, body = raw.partition(b"\0")
+        return body if header.startswith(b"commit ") else None
+
+    try:
+        reader = _PackReader(objects_dir)
+        location = reader.find(bytes.fromhex(sha))
+        if location is None:
+            return None
+        obj_type, body = reader.read_at(*location)
+    except (OSError, ValueError, IndexError, struct.error, zlib.error):
+        return None
+    return body if obj_type == OBJ_COMMIT else None
+
+
+def parse_commit(body: bytes) -> dict:
+    """Extract subject and author time from a commit body.
+
+    The subject follows ``git log --format=%s``: the first paragraph of the
+    message with line breaks joined by spaces.
+    """
+    text = body.decode("utf-8", errors="replace")
+    headers, _, message = text.partition("\n\n")
+
+    author_time = 0
+    for line in headers.split("\n"):
+        if line.startswith("author "):
+            match = re.search(r"> (\d+) [+-]\d{4}$", line)
+            if match:
+                author_time = int(match.group(1))
+            break
+
+    paragraph = message.lstrip("\n").split("\n\n", 1)[0]
+    subject = " ".join(line.strip() for line in paragraph.splitlines())
+
+    return {"subject": subject, "author_time": author_time}
+
+
+def format_relative_time(timestamp: int, now: float | None = None) -> str:
+    """Format a timestamp like ``git log --format=%ar``."""
+    def plural(count: int, unit: str) -> str:
+        return f"{count} {unit}" + ("" if count == 1 else "s")
+
+    diff = int((now if now is not None else time.time()) - timestamp)
+    if diff < 0:
+        return "in the future"
+    if diff < 90:
+        return f"{plural(diff, 'second')} ago"
+    diff = (diff + 30) // 60
+    if diff < 90:
+        return f"{plural(diff, 'minute')} ago"
+    diff = (diff + 30) // 60
+    if diff < 36:
+        return f"{plural(diff, 'hour')} ago"
+    diff = (diff + 12) // 24
+    if diff < 14:
+        return f"{plural(diff, 'day')} ago"
+    if diff < 70:
+        return f"{plural((diff + 3) // 7, 'week')} ago"
+    if diff < 365:
+        return f"{plural((diff + 15) // 30, 'month')} ago"
+    if diff < 1825:
+        total_months = (diff * 12 * 2 + 365) // (365 * 2)
+        years, months = divmod(total_months, 12)
+        if months:
+            return f"{plural(years, 'year')}, {plural(months, 'month')} ago"
+        return f"{plural(years, 'year')} ago"
+    return f"{plural((diff + 183) // 365, 'year')} ago"
+
+
+def read_git_metadata(start: Path) -> dict | None:
+    """Read branch and HEAD commit information without running git.
+
+    Args:
+        start: Directory inside the working tree
+
+    Returns:
+        Dictionary with ``branch`` ("" when detached), ``detached``,
+        ``head_commit`` (full sha, "" before the first commit),
+        ``short_commit``, ``subject`` and ``author_time``; or None when the
+        repository layout is not supported and git should be used instead
+    """
+    git_dir = find_git_dir(start)
+    if git_dir is None:
+        return None
+    common_dir = _get_common_dir(git_dir)
+    if (common_dir / "reftable").exists():
+        return None
+    config = _read_git_config(_config_files(common_dir))
+    if config.get("extensions.objectformat", "sha1").lower() != "sha1":
+        return None
+
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    if head.startswith("ref:"):
+        ref = head[4:].strip()
+        branch = ref[len("refs/heads/"):] if ref.startswith("refs/heads/") else ref
+        sha = _resolve_ref(git_dir, common_dir, ref)
+        if sha is None:
+            return None
+    elif SHA_RE.fullmatch(head):
+        branch = ""
+        sha = head
+    else:
+        return None
+
+    metadata = {
+        "branch": branch,
+        "detached": not branch,
+        "head_commit": sha,
+        "short_commit": sha[:abbrev_length(config, common_dir / "objects")] if sha else "",
+        "subject": "",
+        "author_time": 0,
+    }
+    if not sha:
+        return metadata
+
+    body = read_commit_object(common_dir, sha)
+    if body is None:
+        return None
+    metadata.update(parse_commit(body))
+    return metadata
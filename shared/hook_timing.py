@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Hook Phase Timing for Global Claude Rules
+
+Opt-in, low-overhead timing spans around hook phases. Controlled by the
+GLOBAL_CLAUDE_HOOK_TIMING environment variable:
+- unset or "0": disabled, spans are no-ops
+- "1": phase timings are added to the hook's ``performance`` output
+- "log": as "1", and each run is also appended to
+  ``~/.claude/cache/hook_timings.jsonl`` (rotated at 1 MB, 3 backups)
+
+Log records are one JSON object per line with ``timestamp``, ``hook``,
+``total_ms`` and ``phases`` (name -> milliseconds), plus optional
+``tool_name`` and ``collectors``.
+
+Like rule_parser.py, this module is stdlib-only so it can be copied next
+to the hooks (``hooks/moai/lib/``).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator
+
+TIMING_ENV_VAR = "GLOBAL_CLAUDE_HOOK_TIMING"
+TIMING_LOG_FILE = Path.home() / ".claude" / "cache" / "hook_timings.jsonl"
+TIMING_LOG_MAX_BYTES = 1024 * 1024
+TIMING_LOG_BACKUPS = 3
+
+DISABLED_VALUES = {"", "0", "off", "false", "no"}
+
+
+class PhaseTimer:
+    """Collects named timing spans for one hook run."""
+
+    def __init__(self, hook: str, mode: str | None = None):
+        """
+        Args:
+            hook: Hook event name recorded in the log (e.g. "SessionStart")
+            mode: Timing mode; defaults to $GLOBAL_CLAUDE_HOOK_TIMING
+        """
+        if mode is None:
+            mode = os.getenv(TIMING_ENV_VAR, "")
+        mode = mode.strip().lower()
+
+        self.hook = hook
+        self.enabled = mode not in DISABLED_VALUES
+        self.log_enabled = mode == "log"
+        self.phases: dict[str, float] = {}
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as phase ``name`` (no-op when disabled)."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = round((time.perf_counter() - start) * 1000, 2)
+
+    def total_ms(self) -> float:
+        """Milliseconds since the timer was created."""
+        return round((time.perf_counter() - self._start) * 1000, 2)
+
+    def write_log(self, extra: dict | None = None, log_path: Path | None = None) -> None:
+        """Append this run to the timing log when logging is enabled.
+
+        Args:
+            extra: Additional record fields (e.g. tool_name, collectors)
+            log_path: Log file (default: ~/.claude/cache/hook_timings.jsonl)
+        """
+        if not self.log_enabled:
+            return
+        record = {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "hook": self.hook,
+            "total_ms": self.total_ms(),
+            "phases": self.phases,
+        }
+        record.update(extra or {})
+        append_timing_record(record, log_path)
+
+
+def _rotate(log_path: Path, backups: int) -> None:
+    """Shift hook_timings.jsonl -> .1 -> .2 ..., dropping the oldest."""
+    for index in range(backups - 1, 0, -1):
+        older = log_path.with_name(f"{log_path.name}.{index}")
+        if older.exists():
+            os.replace(older, log_path.with_name(f"{log_path.name}.{index + 1}"))
+    os.replace(log_path, log_path.with_name(f"{log_path.name}.1"))
+
+
+def append_timing_record(
+    record: dict,
+    log_path: Path | None = None,
+    max_bytes: int = TIMING_LOG_MAX_BYTES,
+    backups: int = TIMING_LOG_BACKUPS,
+) -> None:
+    """Append one record to the JSONL timing log; failures are ignored.
+
+    Each record is written with a single append, so concurrent hook
+    processes do not interleave lines.
+    """
+    log_path = log_path or TIMING_LOG_FILE
+    line = json.dumps(record, ensure_ascii=False) + "\n"
+    try:
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            if log_path.stat().st_size + len(line) > max_bytes:
+                _rotate(log_path, backups)
+        except FileNotFoundError:
+            pass
+        with open(log_path, "a", encoding="utf-8") as f:
+            f.write(line)
+    except OSError:
+        pass
+
+
+def timing_log_files(log_path: Path | None = None, backups: int = TIMING_LOG_BACKUPS) -> list[Path]:
+    """Existing timing log files, oldest first."""
+    log_path = log_path or TIMING_LOG_FILE
+    candidates = [log_path.with_name(f"{log_path.name}.{index}") for index in range(backups, 0, -1)]
+    candidates.append(log_path)
+    return [path for path in candidates if path.exists()]
+
+
+def read_timing_records(log_path: Path | None = None, backups: int = TIMING_LOG_BACKUPS) -> list[dict]:
+    """Read all timing records, including rotated files, oldest first.
+
+    Lines that are not JSON objects (e.g. a partially written last line)
+    are skipped.
+    """
+    records = []
+    for path in timing_log_files(log_path, backups):
+        try:
+            lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
+        except OSError:
+            continue
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict):
+                records.append(record)
+    return records
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Single-Pass ERR Rule Parser for Global Claude Rules
+
+Tokenizes memory.md content once and emits one record per ``### ERR-XXX:``
+rule, so parsing cost grows linearly with file size instead of with
+rules x lines.
+
+This module is stdlib-only and has no package-relative imports, so the
+installer can copy it next to the hooks (``hooks/moai/lib/``).
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Iterator
+
+# A line that opens a rule block (same test the validator has always used)
+RULE_START_RE = re.compile(r'###\s+ERR-\d+:')
+
+# ID and title extraction for a rule header line
+RULE_HEADER_RE = re.compile(r'### (ERR-\d+):\s*(.+)')
+
+# Field markers, checked in this order on every body line
+FIELD_MARKERS = (
+    ('**Problem**:', 'problem'),
+    ('**Root Cause**:', 'root_cause'),
+    ('**Solution**:', 'solution'),
+    ('**Prevention**:', 'prevention'),
+    ('**Date**:', 'date'),
+    ('**Project**:', 'project'),
+    ('**Category**:', 'category'),
+)
+
+
+def _new_rule(header: str, line_no: int, offset: int, byte_offset: int) -> dict:
+    """Create an empty rule record for a header line."""
+    rule = {
+        'id': '',
+        'title': '',
+        'problem': '',
+        'root_cause': '',
+        'solution': '',
+        'prevention': '',
+        'date': '',
+        'project': '',
+        'category': '',
+        'line': line_no,
+        'end_line': line_no,
+        'offset': offset,
+        'end_offset': offset,
+        'byte_offset': byte_offset,
+        'end_byte_offset': byte_offset,
+    }
+
+    header_match = RULE_HEADER_RE.search(header)
+    if header_match:
+        rule['id'] = header_match.group(1)
+        rule['title'] = header_match.group(2).strip()
+
+    return rule
+
+
+def iter_rules(content: str) -> Iterator[dict]:
+    """Yield every ERR rule in the content in a single pass.
+
+    Each record holds the rule fields plus its location:
+    ``line``/``end_line`` (1-based, end exclusive), ``offset``/``end_offset``
+    (character offsets into ``content``) and ``byte_offset``/``end_byte_offset``
+    (UTF-8 byte offsets). A rule ends at the next rule header or ``## `` section.
+
+    Headers without a parsable ID (e.g. ``### ERR-XXX: [Title]``) are skipped.
+
+    Args:
+        content: The memory.md file content
+
+    Yields:
+        Rule dictionaries in file order
+    """
+    rule = None
+    offset = 0
+    byte_offset = 0
+
+    for line_no, line in enumerate(content.split("\n"), start=1):
+        is_rule_start = line.startswith('###') and RULE_START_RE.match(line)
+
+        if rule is not None and (is_rule_start or line.startswith('## ')):
+            rule['end_line'] = line_no
+            rule['end_offset'] = offset
+            rule['end_byte_offset'] = byte_offset
+            if rule['id']:
+                yield rule
+            rule = None
+
+        if is_rule_start:
+            rule = _new_rule(line, line_no, offset, byte_offset)
+        elif rule is not None and '**' in line:
+            for marker, field in FIELD_MARKERS:
+                if marker in line:
+                    rule[field] = line.split(marker, 1)[1].strip()
+                    break
+
+        offset += len(line) + 1
+        byte_offset += (len(line) if line.isascii() else len(line.encode("utf-8"))) + 1
+
+    if rule is not None:
+        rule['end_line'] = line_no + 1
+        rule['end_offset'] = len(content)
+        rule['end_byte_offset'] = byte_offset - 1
+        if rule['id']:
+            yield rule
+
+
+def parse_rules(content: str) -> list[dict]:
+    """Parse all ERR rules in the content.
+
+    Args:
+        content: The memory.md file content
+
+    Returns:
+        List of rule dictionaries in file order
+    """
+    return list(iter_rules(content))
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Compiled Rule Snapshot for Global Claude Rules
+
+Hooks run as short-lived processes, so re-reading and regex-parsing the
+whole memory.md on every run adds up. This module compiles memory.md once
+into a JSON snapshot under ``~/.claude/cache/`` and reuses it while the
+source file is unchanged.
+
+The snapshot holds only what the hooks display (rule count, Last Updated
+date, quick reference table, essential rules), so a warm load stays small.
+The full parsed rule list is kept in a separate file that is only built
+and read by ``load_snapshot_rules``.
+
+Invalidation:
+- size + mtime match: the snapshot is used without reading memory.md
+- size/mtime changed but SHA-256 matches (e.g. touched by git): the stat
+  key is refreshed and the snapshot reused
+- content changed: memory.md is parsed again and the snapshot rewritten
+
+Like rule_parser.py, this module is stdlib-only so it can be copied next
+to the hooks (``hooks/moai/lib/``).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+
+try:
+    from .rule_parser import parse_rules
+except ImportError:
+    from rule_parser import parse_rules
+
+# Bump when the snapshot layout changes so older snapshots are rebuilt
+SNAPSHOT_VERSION = 2
+
+# Default snapshot locations
+SNAPSHOT_FILE = Path.home() / ".claude" / "cache" / "rules_snapshot.json"
+RULES_FILE = Path.home() / ".claude" / "cache" / "rules_snapshot_rules.json"
+
+# Number of lines of the essential section injected at session start
+ESSENTIAL_RULES_MAX_LINES = 300
+
+QUICK_REFERENCE_RE = re.compile(r"\| Error ID \|.*?\n(\|.*?\|.*?\|.*?\|\n)+", re.MULTILINE)
+LAST_UPDATED_RE = re.compile(r"\*\*Last Updated\*\*: (\d{4}-\d{2}-\d{2})")
+
+
+def extract_essential_rules(content: str) -> list[str]:
+    """Extract the essential rule lines injected at session start.
+
+    Collects lines from the "Common Errors Across All Projects" section (or
+    the first ERR-001 rule) up to, but not including, ERR-017.
+
+    Args:
+        content: The memory.md file content
+
+    Returns:
+        List of lines (at most ESSENTIAL_RULES_MAX_LINES)
+    """
+    essential_rules = []
+    in_essential_section = False
+
+    for line in content.split("\n"):
+        if "## 4. Common Errors Across All Projects" in line or "ERR-001:" in line:
+            in_essential_section = True
+
+        if in_essential_section and line.startswith("## ") and "Common Errors" not in line:
+            if "ERR-" not in line:
+                break
+
+        if in_essential_section:
+            if "ERR-017:" in line:
+                break
+            essential_rules.append(line)
+
+    return essential_rules[:ESSENTIAL_RULES_MAX_LINES]
+
+
+def compile_snapshot(content: str) -> dict:
+    """Compile memory.md content into a snapshot dictionary.
+
+    Args:
+        content: The memory.md file content
+
+    Returns:
+        Snapshot with rule_count, last_updated, quick_reference and
+        essential_rules
+    """
+    rules = parse_rules(content)
+
+    quick_ref_match = QUICK_REFERENCE_RE.search(content)
+    date_match = LAST_UPDATED_RE.search(content)
+
+    return {
+        "version": SNAPSHOT_VERSION,
+        "rule_count": len({rule["id"] for rule in rules}),
+        "last_updated": date_match.group(1) if date_match else "Unknown",
+        "quick_reference": quick_ref_match.group(0) if quick_ref_match else "",
+        "essential_rules": extract_essential_rules(content),
+    }
+
+
+def compile_rule_list(content: str) -> dict:
+    """Compile memory.md content into the on-demand rule list.
+
+    Args:
+        content: The memory.md file content
+
+    Returns:
+        Dictionary with the parsed rules (see rule_parser.parse_rules)
+    """
+    return {
+        "version": SNAPSHOT_VERSION,
+        "rules": parse_rules(content),
+    }
+
+
+def _read_snapshot(snapshot_path: Path) -> dict | None:
+    """Read a snapshot file, returning None if missing or unusable."""
+    try:
+        snapshot = json.loads(snapshot_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+        return None
+    return snapshot
+
+
+def _write_snapshot(snapshot_path: Path, snapshot: dict) -> None:
+    """Atomically write a snapshot file; failures are ignored."""
+    tmp_path = snapshot_path.with_name(f"{snapshot_path.name}.{os.getpid()}.tmp")
+    try:
+        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(snapshot, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, snapshot_path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def _load_compiled(memory_path: Path, snapshot_path: Path, compile_func) -> dict:
+    """Load a compiled file for memory.md, rebuilding it with compile_func if stale.
+
+    Raises:
+        OSError: If memory.md cannot be read
+    """
+    stat = memory_path.stat()
+    source_key = {
+        "path": str(memory_path.resolve()),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+
+    snapshot = _read_snapshot(snapshot_path)
+    source = snapshot.get("source", {}) if snapshot else {}
+    if snapshot and all(source.get(key) == value for key, value in source_key.items()):
+        return snapshot
+
+    data = memory_path.read_bytes()
+    source_key["sha256"] = hashlib.sha256(data).hexdigest()
+
+    if not snapshot or source.get("path") != source_key["path"] or source.get("sha256") != source_key["sha256"]:
+        snapshot = compile_func(data.decode("utf-8", errors="replace"))
+
+    snapshot["source"] = source_key
+    _write_snapshot(snapshot_path, snapshot)
+    return snapshot
+
+
+def load_rule_snapshot(memory_path: Path, snapshot_path: Path | None = None) -> dict:
+    """Load the compiled snapshot for memory.md, rebuilding it if stale.
+
+    Args:
+        memory_path: Path to memory.md
+        snapshot_path: Snapshot file (default: ~/.claude/cache/rules_snapshot.json)
+
+    Returns:
+        Snapshot dictionary (see compile_snapshot) plus a "source" key
+
+    Raises:
+        OSError: If memory.md cannot be read
+    """
+    return _load_compiled(memory_path, snapshot_path or SNAPSHOT_FILE, compile_snapshot)
+
+
+def load_snapshot_rules(memory_path: Path, rules_path: Path | None = None) -> list[dict]:
+    """Load the parsed rule list for memory.md, rebuilding it if stale.
+
+    Uses the same size/mtime/SHA-256 invalidation as load_rule_snapshot but
+    a separate file, so hooks that only need the summary never read it.
+
+    Args:
+        memory_path: Path to memory.md
+        rules_path: Rule list file (default: ~/.claude/cache/rules_snapshot_rules.json)
+
+    Returns:
+        List of rule dictionaries (see rule_parser.parse_rules)
+
+    Raises:
+        OSError: If memory.md cannot be read
+    """
+    return _load_compiled(memory_path, rules_path or RULES_FILE, compile_rule_list)["rules"]
@@ -16,12 +16,17 @@ Enhanced Features:
 
 from __future__ import annotations
 
+import contextlib
 import json
 import logging
 import os
 import re
+import shutil
 import subprocess
 import sys
+import threading
+import time
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -39,6 +44,32 @@ if sys.platform == "win32":
 # =============================================================================
 # Environment-Aware Path Detection
 # =============================================================================
+# Filesystem checks (exists/stat/is_dir/iterdir) made by this hook, reported
+# as performance.path_stats. Checks inside the lib modules (memory.md stat,
+# .git lookup) and shutil.which() are not counted.
+_path_stat_count = 0
+_path_stat_lock = threading.Lock()
+
+
+def count_path_stats(count: int = 1) -> None:
+    """Record filesystem checks for the performance report (thread-safe)."""
+    global _path_stat_count
+    with _path_stat_lock:
+        _path_stat_count += count
+
+
+def path_exists(path: Path) -> bool:
+    """Path.exists() that counts filesystem checks for the performance report."""
+    count_path_stats()
+    return path.exists()
+
+
+def path_stat(path: Path) -> os.stat_result:
+    """Path.stat() that counts filesystem checks for the performance report."""
+    count_path_stats()
+    return path.stat()
+
+
 def get_global_memory_path() -> Path:
     """Get the global memory path based on environment.
 
@@ -76,7 +107,7 @@ def get_global_guide_path() -> Path:
     if sys.platform == "win32":
         # Try D: drive first (common Windows setup)
         d_drive_path = Path("D:/GLOBAL_RULES_GUIDE.md")
-        if d_drive_path.exists():
+        if path_exists(d_drive_path):
             return d_drive_path
 
     # Default to home directory
@@ -115,6 +146,21 @@ RISK_COVERAGE_UNKNOWN = 5
 SETUP_MESSAGE_RESCAN_DAYS = 7
 AUTO_SYNC_INTERVAL_DAYS = 7
 AUTO_SYNC_CACHE_FILE = Path.home() / ".claude" / "cache" / "auto_sync.json"
+MOAI_VERSION_CACHE_FILENAME = "moai-version.json"
+
+# Per-collector time budgets (seconds) for the concurrent session start
+# collectors. All stay below the 5 second hook timeout so a partial result
+# is always printed; collectors that miss their budget are shown as pending,
+# collectors that raised are shown as unavailable.
+SESSION_COLLECTOR_BUDGETS = {
+    "git_info": 3.0,
+    "personalization": 2.0,
+    "version": 2.0,
+    "global_memory_summary": 3.0,
+    "global_rules": 3.5,
+}
+PENDING = "pending"
+UNAVAILABLE = "unavailable"
 
 # =============================================================================
 # Setup import path for shared modules
@@ -132,7 +178,7 @@ except ImportError:
     def check_file_size(file_path: Path, max_size_mb: int = 10) -> tuple[bool, str]:
         """Check if file size is within safe limits."""
         try:
-            size = file_path.stat().st_size
+            size = path_stat(file_path).st_size
             if size > max_size_mb * 1024 * 1024:
                 return False, f"File too large: {size / 1024 / 1024:.1f}MB"
             return True, ""
@@ -143,12 +189,69 @@ except ImportError:
         """Find project root by looking for .moai directory."""
         cwd = Path.cwd()
         for parent in [cwd] + list(cwd.parents):
-            if (parent / ".moai").exists():
+            if path_exists(parent / ".moai"):
                 return parent
-            if (parent / ".git").exists():
+            if path_exists(parent / ".git"):
                 return parent
         return cwd
 
+# =============================================================================
+# Per-Invocation Path Resolution
+# =============================================================================
+class HookPaths:
+    """Paths resolved once per hook invocation.
+
+    find_project_root() walks from the working directory up to / checking
+    .moai and .git at every level, and most collectors need the project
+    root. Resolving it once here keeps them from repeating the walk.
+    """
+
+    def __init__(self, project_root: Path):
+        self.project_root = project_root
+        self.config_dir = project_root / ".moai" / "config"
+        self.specs_dir = project_root / ".moai" / "specs"
+        self.cache_dir = project_root / ".moai" / "cache"
+        self.project_memory_path = project_root / ".claude" / "memory.md"
+        self.lessons_path = project_root / "doc" / "LESSONS_LEARNED.md"
+        self.global_memory_path = get_global_memory_path()
+        self.global_guide_path = get_global_guide_path()
+        self._exists: dict[Path, bool] = {}
+
+    def exists(self, path: Path) -> bool:
+        """Check whether a hook input exists, statting it at most once.
+
+        Only for files the hook reads; files it writes may appear later.
+        """
+        if path not in self._exists:
+            self._exists[path] = path_exists(path)
+        return self._exists[path]
+
+
+_hook_paths: HookPaths | None = None
+
+
+def get_hook_paths() -> HookPaths:
+    """Get the paths for this hook run, resolving the project root once."""
+    global _hook_paths
+    if _hook_paths is None:
+        _hook_paths = HookPaths(find_project_root())
+    return _hook_paths
+
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    """Write a cache file via a temporary file and rename; failures are ignored."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
 # Import unified timeout manager and Git operations manager
 try:
     from lib.git_operations_manager import GitOperationType, get_git_manager
@@ -195,15 +298,125 @@ except ImportError:
         pass
 
 
+# Import subprocess-free git metadata reader
+try:
+    from lib.git_metadata import find_git_dir, format_relative_time, read_git_metadata
+except ImportError:
+    def find_git_dir(start: Path) -> Path | None:
+        """Find the .git directory (or gitdir file target) for start."""
+        for parent in [start] + list(start.parents):
+            if path_exists(parent / ".git"):
+                return parent / ".git"
+        return None
+
+    def format_relative_time(timestamp: int, now: float | None = None) -> str:
+        return ""
+
+    def read_git_metadata(start: Path) -> dict | None:
+        """Metadata reader not installed; git commands are used instead."""
+        return None
+
+
+# Import compiled rule snapshot
+try:
+    from lib.rule_snapshot import load_rule_snapshot
+except ImportError:
+    def load_rule_snapshot(memory_path: Path, snapshot_path: Path | None = None) -> dict:
+        """Parse memory.md directly (snapshot module not installed)."""
+        content = memory_path.read_text(encoding="utf-8", errors="replace")
+
+        essential_rules = []
+        in_essential_section = False
+        for line in content.split("\n"):
+            if "## 4. Common Errors Across All Projects" in line or "ERR-001:" in line:
+                in_essential_section = True
+            if in_essential_section and line.startswith("## ") and "Common Errors" not in line:
+                if "ERR-" not in line:
+                    break
+            if in_essential_section:
+                if "ERR-017:" in line:
+                    break
+                essential_rules.append(line)
+
+        quick_ref_match = re.search(r"\| Error ID \|.*?\n(\|.*?\|.*?\|.*?\|\n)+", content, re.MULTILINE)
+        date_match = re.search(r"\*\*Last Updated\*\*: (\d{4}-\d{2}-\d{2})", content)
+
+        return {
+            "rule_count": len(set(re.findall(r"### ERR-(\d+):", content))),
+            "last_updated": date_match.group(1) if date_match else "Unknown",
+            "quick_reference": quick_ref_match.group(0) if quick_ref_match else "",
+            "essential_rules": essential_rules[:300],
+        }
+
+
+_global_snapshot: dict | None = None
+_global_snapshot_lock = threading.Lock()
+
+
+def get_global_rule_snapshot(paths: HookPaths | None = None) -> dict:
+    """Get the compiled global memory snapshot, loaded once per hook run.
+
+    Raises:
+        OSError: If the global memory file cannot be read
+    """
+    global _global_snapshot
+    with _global_snapshot_lock:
+        if _global_snapshot is None:
+            paths = paths or get_hook_paths()
+            _global_snapshot = load_rule_snapshot(paths.global_memory_path)
+    return _global_snapshot
+
+
+# Import opt-in phase timing
+try:
+    from lib.hook_timing import PhaseTimer
+except ImportError:
+    class PhaseTimer:
+        """Timing module not installed; spans are no-ops."""
+
+        enabled = False
+
+        def __init__(self, hook: str, mode: str | None = None):
+            self.phases: dict[str, float] = {}
+
+        @contextlib.contextmanager
+        def span(self, name: str):
+            yield
+
+        def write_log(self, extra: dict | None = None, log_path: Path | None = None) -> None:
+            pass
+
+
 # Import config cache
 try:
     from core.config_cache import get_cached_config, get_cached_spec_progress
 except ImportError:
-    try:
-        import yaml as yaml_fallback
-        HAS_YAML_FALLBACK = True
-    except ImportError:
-        HAS_YAML_FALLBACK = False
+    # Merged config snapshot, reused while every contributing file keeps its
+    # size and mtime. Bump the version when the snapshot layout changes.
+    CONFIG_CACHE_VERSION = 1
+    CONFIG_CACHE_FILENAME = "config-cache.json"
+    CONFIG_SECTION_FILES = [
+        ("user.yaml", "user"),
+        ("language.yaml", "language"),
+        ("git-strategy.yaml", "git_strategy"),
+        ("project.yaml", "project"),
+        ("quality.yaml", "quality"),
+        ("system.yaml", "system"),
+    ]
+
+    _yaml_module: Any = None
+    _config_memo: dict[Path, dict | None] = {}
+
+    def _get_yaml_module():
+        """Import PyYAML on first use; returns None if it is not installed."""
+        global _yaml_module
+        if _yaml_module is None:
+            try:
+                import yaml
+                _yaml_module = yaml
+            except ImportError:
+                _yaml_module = False
+        return _yaml_module or None
 
     def _simple_yaml_parse(content: str) -> dict:
         """Simple YAML parser for basic configs."""
@@ -272,29 +485,98 @@ except ImportError:
         return result
 
     def _load_yaml_file(file_path: Path) -> dict:
-        if not file_path.exists():
+        if not path_exists(file_path):
             return {}
         is_safe, _ = check_file_size(file_path)
         if not is_safe:
             return {}
         try:
             content = file_path.read_text(encoding="utf-8", errors="replace")
-            if HAS_YAML_FALLBACK:
-                return yaml_fallback.safe_load(content) or {}
+            yaml_module = _get_yaml_module()
+            if yaml_module:
+                return yaml_module.safe_load(content) or {}
             else:
                 return _simple_yaml_parse(content)
         except Exception:
             return {}
 
-    def get_cached_config():
-        project_root = find_project_root()
-        config_dir = project_root / ".moai" / "config"
+    def _config_source_key(config_dir: Path) -> list:
+        """Size and mtime of every file that can contribute to the config."""
+        relative_paths = ["config.yaml", "config.json"]
+        relative_paths += [f"sections/{filename}" for filename, _ in CONFIG_SECTION_FILES]
+
+        source_key = []
+        for relative_path in relative_paths:
+            try:
+                stat = path_stat(config_dir / relative_path)
+                source_key.append([relative_path, stat.st_size, stat.st_mtime_ns])
+            except OSError:
+                source_key.append([relative_path, None, None])
+        return source_key
+
+    def _read_config_cache(cache_file: Path, source_key: list) -> tuple[bool, dict | None]:
+        """Return (hit, config) for the on-disk merged config snapshot."""
+        try:
+            snapshot = json.loads(cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False, None
+        if not isinstance(snapshot, dict) or snapshot.get("version") != CONFIG_CACHE_VERSION:
+            return False, None
+        if snapshot.get("source") != source_key:
+            return False, None
+        return True, snapshot.get("config")
+
+    def _write_config_cache(cache_file: Path, source_key: list, config: dict | None) -> None:
+        """Atomically write the merged config snapshot; failures are ignored.
+
+        Configs that do not survive a JSON round trip (e.g. YAML dates) are
+        not cached so callers always see the types the loader produced.
+        """
+        try:
+            serialized = json.dumps(
+                {"version": CONFIG_CACHE_VERSION, "source": source_key, "config": config},
+                ensure_ascii=False,
+            )
+            if json.loads(serialized)["config"] != config:
+                return
+        except (TypeError, ValueError):
+            return
+        _atomic_write_text(cache_file, serialized)
+
+    def get_cached_config(paths: HookPaths | None = None):
+        """Get the merged project config, parsing YAML only when it changed.
+
+        The result is memoized for the hook run and snapshotted to
+        .moai/cache/config-cache.json, keyed on the size and mtime of
+        config.yaml, config.json and sections/*.yaml.
+        """
+        paths = paths or get_hook_paths()
+        config_dir = paths.config_dir
+        if config_dir in _config_memo:
+            return _config_memo[config_dir]
+
+        if not paths.exists(config_dir):
+            _config_memo[config_dir] = None
+            return None
+
+        cache_file = paths.cache_dir / CONFIG_CACHE_FILENAME
+        source_key = _config_source_key(config_dir)
+        hit, config = _read_config_cache(cache_file, source_key)
+        if not hit:
+            config = _load_config_files(config_dir)
+            _write_config_cache(cache_file, source_key, config)
+
+        _config_memo[config_dir] = config
+        return config
+
+    def _load_config_files(config_dir: Path) -> dict | None:
+        """Read and merge config.yaml (or config.json) and the section files."""
         main_config_path = config_dir / "config.yaml"
         config = _load_yaml_file(main_config_path)
 
         if not config:
             json_config_path = config_dir / "config.json"
-            if json_config_path.exists():
+            if path_exists(json_config_path):
                 is_safe, _ = check_file_size(json_config_path)
                 if is_safe:
                     try:
@@ -303,16 +585,8 @@ except ImportError:
                         config = {}
 
         sections_dir = config_dir / "sections"
-        if sections_dir.exists():
-            section_files = [
-                ("user.yaml", "user"),
-                ("language.yaml", "language"),
-                ("git-strategy.yaml", "git_strategy"),
-                ("project.yaml", "project"),
-                ("quality.yaml", "quality"),
-                ("system.yaml", "system"),
-            ]
-            for filename, key in section_files:
+        if path_exists(sections_dir):
+            for filename, _key in CONFIG_SECTION_FILES:
                 section_path = sections_dir / filename
                 section_data = _load_yaml_file(section_path)
                 if section_data:
@@ -320,19 +594,20 @@ except ImportError:
 
         return config if config else None
 
-    def get_cached_spec_progress():
-        project_root = find_project_root()
-        specs_dir = project_root / ".moai" / "specs"
+    def get_cached_spec_progress(paths: HookPaths | None = None):
+        specs_dir = (paths or get_hook_paths()).specs_dir
 
-        if not specs_dir.exists():
+        if not path_exists(specs_dir):
             return {"completed": 0, "total": 0, "percentage": 0}
         try:
-            spec_folders = [d for d in specs_dir.iterdir() if d.is_dir() and d.name.startswith("SPEC-")]
+            entries = list(specs_dir.iterdir())
+            spec_folders = [d for d in entries if d.name.startswith("SPEC-") and d.is_dir()]
+            count_path_stats(1 + sum(1 for d in entries if d.name.startswith("SPEC-")))
             total = len(spec_folders)
             completed = 0
             for folder in spec_folders:
                 spec_file = folder / "spec.md"
-                if not spec_file.exists():
+                if not path_exists(spec_file):
                     continue
                 try:
                     content = spec_file.read_text(encoding="utf-8", errors="replace")
@@ -378,19 +653,21 @@ def should_show_setup_messages() -> bool:
         return True
 
 
-def check_git_initialized() -> bool:
+def check_git_initialized(paths: HookPaths | None = None) -> bool:
     """Check if git repository is initialized."""
     try:
-        project_root = find_project_root()
-        git_dir = project_root / ".git"
-        return git_dir.exists() and git_dir.is_dir()
+        paths = paths or get_hook_paths()
+        project_root = paths.project_root
+        # .git may be a directory or a file pointing to a worktree gitdir
+        return paths.exists(project_root / ".git") and find_git_dir(project_root) is not None
     except Exception:
         return False
 
 
-def get_git_info() -> dict[str, Any]:
+def get_git_info(paths: HookPaths | None = None) -> dict[str, Any]:
     """Get comprehensive git information."""
-    if not check_git_initialized():
+    paths = paths or get_hook_paths()
+    if not check_git_initialized(paths):
         return {
             "branch": "Git not initialized",
             "last_commit": "Git not initialized",
@@ -421,56 +698,49 @@ def get_git_info() -> dict[str, Any]:
         except Exception as e:
             logging.warning(f"Git manager failed: {e}")
 
-    # Fallback
+    # Fallback: read HEAD and the last commit from .git directly and spawn git
+    # only for the working tree status. If the repository layout is not
+    # supported, run status and log concurrently instead.
     try:
-        import concurrent.futures
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-
-        git_commands = [
-            (["git", "branch", "--show-current"], "branch"),
-            (["git", "rev-parse", "--abbrev-ref", "HEAD"], "head_ref"),
-            (["git", "rev-parse", "--short", "HEAD"], "head_commit"),
-            (["git", "log", "--pretty=format:%h %s", "-1"], "last_commit"),
-            (["git", "log", "--pretty=format:%ar", "-1"], "commit_time"),
-            (["git", "status", "--porcelain"], "changes_raw"),
-        ]
-
-        results = {}
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            futures = {executor.submit(_run_git_command_fallback, cmd): key for cmd, key in git_commands}
-            try:
-                for future in as_completed(futures, timeout=8):
-                    key = futures[future]
-                    try:
-                        results[key] = future.result()
-                    except (TimeoutError, RuntimeError):
-                        results[key] = ""
-            except concurrent.futures.TimeoutError:
-                for future, key in futures.items():
-                    if future.done():
-                        try:
-                            if key not in results:
-                                results[key] = future.result()
-                        except (TimeoutError, RuntimeError):
-                            results[key] = ""
-
-        branch = results.get("branch", "")
-        head_ref = results.get("head_ref", "")
-        if not branch and head_ref == "HEAD":
-            branch = f"HEAD detached at {results.get('head_commit', '')}"
+        metadata = read_git_metadata(paths.project_root)
+        if metadata is not None:
+            status_output = _run_git_commands_concurrently([
+                ["git", "status", "--porcelain=v2", "--branch"],
+            ])[0]
+            status = _parse_porcelain_v2_status(status_output)
+            status["branch"] = metadata["branch"] or "(detached)"
+            head_commit = metadata["short_commit"]
+            subject = metadata["subject"]
+            commit_time = format_relative_time(metadata["author_time"]) if head_commit else ""
+        else:
+            status_output, log_output = _run_git_commands_concurrently([
+                ["git", "status", "--porcelain=v2", "--branch"],
+                ["git", "log", "-1", "--pretty=format:%h%x00%s%x00%ar"],
+            ])
+            status = _parse_porcelain_v2_status(status_output)
+
+            head_commit, subject, commit_time = "", "", ""
+            if log_output:
+                head_commit, subject, commit_time = (log_output.split("\0") + ["", ""])[:3]
+
+        branch = status["branch"]
+        if branch == "(detached)":
+            branch = f"HEAD detached at {head_commit}"
         elif not branch:
             branch = "No commits yet"
 
-        last_commit = results.get("last_commit", "")
-        if not last_commit:
-            last_commit = "No commits yet"
+        last_commit = f"{head_commit} {subject}" if head_commit else "No commits yet"
 
         return {
             "branch": branch,
             "last_commit": last_commit,
-            "commit_time": results.get("commit_time", ""),
-            "changes": (len(results.get("changes_raw", "").splitlines()) if results.get("changes_raw") else 0),
+            "commit_time": commit_time,
+            "changes": status["changes"],
             "git_initialized": True,
+            "head_commit": head_commit,
+            "upstream": status["upstream"],
+            "ahead": status["ahead"],
+            "behind": status["behind"],
         }
 
     except (RuntimeError, OSError, TimeoutError):
@@ -483,13 +753,62 @@ def get_git_info() -> dict[str, Any]:
         }
 
 
-def _run_git_command_fallback(cmd: list[str]) -> str:
-    """Fallback git command execution."""
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=3)
-        return result.stdout.strip() if result.returncode == 0 else ""
-    except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError, OSError):
-        return ""
+def _parse_porcelain_v2_status(output: str) -> dict[str, Any]:
+    """Parse `git status --porcelain=v2 --branch` output.
+
+    Header lines carry branch, upstream and ahead/behind counts; every other
+    line is one changed, unmerged or untracked path.
+    """
+    status: dict[str, Any] = {"branch": "", "upstream": "", "ahead": 0, "behind": 0, "changes": 0}
+
+    for line in output.splitlines():
+        if line.startswith("# branch.head "):
+            status["branch"] = line[len("# branch.head "):]
+        elif line.startswith("# branch.upstream "):
+            status["upstream"] = line[len("# branch.upstream "):]
+        elif line.startswith("# branch.ab "):
+            ahead, _, behind = line[len("# branch.ab "):].partition(" ")
+            try:
+                status["ahead"] = int(ahead.lstrip("+"))
+                status["behind"] = int(behind.lstrip("-"))
+            except ValueError:
+                pass
+        elif line and not line.startswith("#"):
+            status["changes"] += 1
+
+    return status
+
+
+def _run_git_commands_concurrently(commands: list[list[str]], timeout: float = 3) -> list[str]:
+    """Start all git commands at once and collect their stdout.
+
+    Returns:
+        Stripped stdout per command, or "" if the command failed
+    """
+    processes = []
+    for cmd in commands:
+        try:
+            processes.append(
+                subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+            )
+        except (subprocess.SubprocessError, FileNotFoundError, OSError):
+            processes.append(None)
+
+    outputs = []
+    for process in processes:
+        if process is None:
+            outputs.append("")
+            continue
+        try:
+            stdout, _ = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            outputs.append("")
+            continue
+        outputs.append(stdout.strip() if process.returncode == 0 else "")
+
+    return outputs
 
 
 def get_git_strategy_info(config: dict) -> dict:
@@ -523,7 +842,64 @@ def _is_newer_version(newer: str, older: str) -> bool:
     return newer_parts > older_parts
 
 
-def check_version_update() -> tuple[str, bool]:
+def get_moai_version(config: dict | None, paths: HookPaths | None = None) -> str:
+    """Get the installed MoAI-ADK version without spawning `moai` when possible.
+
+    Order:
+    1. importlib.metadata, when moai-adk is installed for this interpreter
+    2. .moai/cache/moai-version.json, keyed on the resolved `moai` executable
+       path and its mtime
+    3. `moai --version`, whose result is then cached
+
+    Falls back to moai.version from the config when `moai` is unavailable.
+    """
+    paths = paths or get_hook_paths()
+    config_version = config.get("moai", {}).get("version", "unknown") if config else "unknown"
+
+    try:
+        import importlib.metadata
+        return importlib.metadata.version("moai-adk")
+    except ImportError:
+        # Includes PackageNotFoundError; moai may be installed elsewhere (e.g. pipx)
+        pass
+
+    executable = shutil.which("moai")
+    if not executable:
+        return config_version
+
+    try:
+        executable_path = Path(executable).resolve()
+        cache_key = {"executable": str(executable_path), "mtime_ns": path_stat(executable_path).st_mtime_ns}
+    except OSError:
+        return config_version
+
+    version_cache_file = paths.cache_dir / MOAI_VERSION_CACHE_FILENAME
+    try:
+        cache_data = json.loads(version_cache_file.read_text(encoding="utf-8"))
+        if all(cache_data.get(key) == value for key, value in cache_key.items()):
+            return cache_data.get("version") or config_version
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    try:
+        result = subprocess.run([executable, "--version"], capture_output=True, text=True, timeout=5)
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        # Not cached: a timeout may be transient
+        return config_version
+
+    moai_version = None
+    if result.returncode == 0:
+        version_match = re.search(r"(\d+\.\d+\.\d+)", result.stdout)
+        moai_version = version_match.group(1) if version_match else "unknown"
+
+    # Only cache inside MoAI projects; never create .moai elsewhere
+    if paths.exists(paths.cache_dir.parent):
+        _atomic_write_text(version_cache_file, json.dumps({**cache_key, "version": moai_version}))
+
+    return moai_version or config_version
+
+
+def check_version_update(paths: HookPaths | None = None) -> tuple[str, bool]:
     """Check if version update is available."""
     try:
         import importlib.metadata
@@ -532,10 +908,10 @@ def check_version_update() -> tuple[str, bool]:
         except importlib.metadata.PackageNotFoundError:
             return "(latest)", False
 
-        version_cache_file = find_project_root() / ".moai" / "cache" / "version-check.json"
+        version_cache_file = (paths or get_hook_paths()).cache_dir / "version-check.json"
         latest_version = None
 
-        if version_cache_file.exists():
+        if path_exists(version_cache_file):
             try:
                 cache_data = json.loads(version_cache_file.read_text(encoding="utf-8", errors="replace"))
                 latest_version = cache_data.get("latest")
@@ -608,11 +984,12 @@ def get_language_info(config: dict) -> dict:
     }
 
 
-def load_user_personalization() -> dict:
+def load_user_personalization(paths: HookPaths | None = None) -> dict:
     """Load user personalization settings."""
+    paths = paths or get_hook_paths()
     try:
         from src.moai_adk.core.language_config_resolver import get_resolver
-        resolver = get_resolver(str(find_project_root()))
+        resolver = get_resolver(str(paths.project_root))
         config = resolver.resolve_config()
 
         user_name = config.get("user_name", "")
@@ -631,7 +1008,7 @@ def load_user_personalization() -> dict:
         }
 
         template_vars = resolver.export_template_variables(config)
-        personalization_cache_file = find_project_root() / ".moai" / "cache" / "personalization.json"
+        personalization_cache_file = paths.cache_dir / "personalization.json"
         try:
             personalization_cache_file.parent.mkdir(parents=True, exist_ok=True)
             cache_data = {
@@ -680,56 +1057,31 @@ def load_user_personalization() -> dict:
         }
 
 
-def inject_global_rules() -> str:
+def inject_global_rules(paths: HookPaths | None = None) -> str:
     """Inject global memory and project-specific rules into session context."""
     parts = []
+    paths = paths or get_hook_paths()
 
-    # Use environment-aware path detection
-    global_memory_path = get_global_memory_path()
-
-    if global_memory_path.exists():
+    if paths.exists(paths.global_memory_path):
         try:
-            global_content = global_memory_path.read_text(encoding="utf-8", errors="replace")
-
-            essential_rules = []
-            lines = global_content.split("\n")
-            current_err = None
-            in_essential_section = False
-
-            for i, line in enumerate(lines):
-                if "## 4. Common Errors Across All Projects" in line or "ERR-001:" in line:
-                    in_essential_section = True
-
-                if in_essential_section and line.startswith("## ") and "Common Errors" not in line:
-                    if "ERR-" not in line:
-                        break
-
-                if in_essential_section:
-                    essential_rules.append(line)
-                    if "ERR-017:" in line:
-                        essential_rules = essential_rules[:-1]
-                        break
+            snapshot = get_global_rule_snapshot(paths)
 
+            essential_rules = snapshot["essential_rules"]
             if essential_rules:
                 parts.append("\n## 🌍 GLOBAL RULES (Auto-loaded)")
                 parts.append("## Common Errors Across All Projects (Claude Code Working)")
-                parts.extend(essential_rules[:300])
+                parts.extend(essential_rules)
 
-            quick_ref_match = re.search(
-                r"\| Error ID \|.*?\n(\|.*?\|.*?\|.*?\|\n)+",
-                global_content,
-                re.MULTILINE
-            )
-            if quick_ref_match:
+            if snapshot["quick_reference"]:
                 parts.append("\n## Error Quick Reference")
-                parts.append(quick_ref_match.group(0))
+                parts.append(snapshot["quick_reference"])
 
         except (OSError, UnicodeDecodeError):
             parts.append("\n⚠️ Global Memory: Unable to read")
 
     # Read project-specific memory
-    project_memory_path = find_project_root() / ".claude" / "memory.md"
-    if project_memory_path.exists():
+    project_memory_path = paths.project_memory_path
+    if paths.exists(project_memory_path):
         try:
             project_content = project_memory_path.read_text(encoding="utf-8", errors="replace")
             parts.append("\n## 📁 PROJECT-SPECIFIC RULES")
@@ -737,8 +1089,8 @@ def inject_global_rules() -> str:
         except (OSError, UnicodeDecodeError):
             pass
 
-    lessons_path = find_project_root() / "doc" / "LESSONS_LEARNED.md"
-    if lessons_path.exists():
+    lessons_path = paths.lessons_path
+    if paths.exists(lessons_path):
         try:
             lessons_content = lessons_path.read_text(encoding="utf-8", errors="replace")
             err_entries = re.findall(r"### ERR-\d+:.*?(?=### ERR-\d+:|##|\Z)", lessons_content, re.DOTALL)
@@ -752,21 +1104,17 @@ def inject_global_rules() -> str:
     return "\n".join(parts)
 
 
-def get_global_memory_summary() -> str:
+def get_global_memory_summary(paths: HookPaths | None = None) -> str:
     """Get summary of global memory rules."""
-    global_memory_path = get_global_memory_path()
-    global_guide_path = get_global_guide_path()
+    paths = paths or get_hook_paths()
 
     output_lines = []
 
-    if global_memory_path.exists():
+    if paths.exists(paths.global_memory_path):
         try:
-            content = global_memory_path.read_text(encoding="utf-8", errors="replace")
-            err_matches = re.findall(r"### ERR-(\d+):", content)
-            err_count = len(set(err_matches))
-
-            date_match = re.search(r"\*\*Last Updated\*\*: (\d{4}-\d{2}-\d{2})", content)
-            last_updated = date_match.group(1) if date_match else "Unknown"
+            snapshot = get_global_rule_snapshot(paths)
+            err_count = snapshot["rule_count"]
+            last_updated = snapshot["last_updated"]
 
             output_lines.append(f"   📚 Global Memory: {err_count} error rules (Last: {last_updated})")
         except (OSError, UnicodeDecodeError):
@@ -774,9 +1122,9 @@ def get_global_memory_summary() -> str:
     else:
         output_lines.append("   ⚠️ Global Memory: File not found")
 
-    if global_guide_path.exists():
+    if paths.exists(paths.global_guide_path):
         try:
-            content = global_guide_path.read_text(encoding="utf-8", errors="replace")
+            content = paths.global_guide_path.read_text(encoding="utf-8", errors="replace")
             version_match = re.search(r"\*\*Version\*\*: ([\d.]+)", content)
             version = version_match.group(1) if version_match else "Unknown"
             output_lines.append(f"   📖 Global Guide: v{version}")
@@ -792,7 +1140,7 @@ def get_last_auto_sync_time() -> datetime | None:
     Returns:
         Last sync datetime or None
     """
-    if AUTO_SYNC_CACHE_FILE.exists():
+    if path_exists(AUTO_SYNC_CACHE_FILE):
         try:
             cache_data = json.loads(AUTO_SYNC_CACHE_FILE.read_text(encoding="utf-8", errors="replace"))
             last_sync = cache_data.get("last_sync")
@@ -803,13 +1151,14 @@ def get_last_auto_sync_time() -> datetime | None:
     return None
 
 
-def save_auto_sync_time() -> None:
+def save_auto_sync_time(paths: HookPaths | None = None) -> None:
     """Save current time as last auto-sync time."""
+    paths = paths or get_hook_paths()
     try:
         AUTO_SYNC_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
         cache_data = {
             "last_sync": datetime.now().isoformat(),
-            "project_root": str(find_project_root()),
+            "project_root": str(paths.project_root),
         }
         AUTO_SYNC_CACHE_FILE.write_text(
             json.dumps(cache_data, ensure_ascii=False, indent=2),
@@ -833,19 +1182,17 @@ def should_auto_sync() -> bool:
     return days_since >= AUTO_SYNC_INTERVAL_DAYS
 
 
-def background_auto_sync() -> None:
+def background_auto_sync(paths: HookPaths | None = None) -> None:
     """Perform background auto-sync of rules.
 
     This function runs git pull in the background to update rules.
     It gracefully handles failures and doesn't block session start.
     """
+    paths = paths or get_hook_paths()
     try:
-        import threading
-
         def sync_in_background():
             try:
-                project_root = find_project_root()
-                os.chdir(project_root)
+                os.chdir(paths.project_root)
 
                 # Check if we're in a git repo with remote
                 result = subprocess.run(
@@ -878,7 +1225,7 @@ def background_auto_sync() -> None:
                             capture_output=True,
                             timeout=60
                         )
-                        save_auto_sync_time()
+                        save_auto_sync_time(paths)
 
             except (subprocess.TimeoutExpired, FileNotFoundError, OSError, ValueError):
                 pass  # Silent failure - don't interrupt session
@@ -887,28 +1234,143 @@ def background_auto_sync() -> None:
         thread = threading.Thread(target=sync_in_background, daemon=True)
         thread.start()
 
-    except ImportError:
+    except RuntimeError:
         pass
 
 
-def format_session_output() -> str:
-    """Format the complete session start output."""
-    git_info = get_git_info()
+def run_collectors(
+    collectors: list[tuple[str, Callable[[], Any], float]],
+) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+    """Run independent collectors concurrently, each within its own budget.
+
+    Collectors run on daemon threads so one that overruns its budget can
+    neither delay the hook output nor keep the process alive afterwards.
+
+    Args:
+        collectors: (name, function, budget in seconds) tuples
+
+    Returns:
+        Tuple of (results by name for collectors that finished in time,
+        timings by name with status "ok", "error" or "pending")
+    """
+    start = time.perf_counter()
+    running = []
+
+    for name, func, budget in collectors:
+        state: dict[str, Any] = {}
+
+        def target(func=func, state=state):
+            collector_start = time.perf_counter()
+            try:
+                state["result"] = func()
+            except Exception as e:
+                state["error"] = f"{type(e).__name__}: {e}"
+            state["ms"] = round((time.perf_counter() - collector_start) * 1000, 1)
+
+        thread = threading.Thread(target=target, name=f"session-start-{name}", daemon=True)
+        thread.start()
+        running.append((name, thread, budget, state))
+
+    results: dict[str, Any] = {}
+    timings: dict[str, dict[str, Any]] = {}
+    for name, thread, budget, state in running:
+        thread.join(max(0.0, start + budget - time.perf_counter()))
+        if thread.is_alive() or "ms" not in state:
+            timings[name] = {"status": PENDING, "budget_ms": budget * 1000}
+        elif "error" in state:
+            timings[name] = {"status": "error", "ms": state["ms"], "error": state["error"]}
+        else:
+            results[name] = state["result"]
+            timings[name] = {"status": "ok", "ms": state["ms"]}
+
+    return results, timings
+
+
+def get_session_collectors(
+    paths: HookPaths, show_messages: bool = True
+) -> list[tuple[str, Callable[[], Any], float]]:
+    """Build the session start collectors with their time budgets."""
+    collectors: list[tuple[str, Callable[[], Any], float]] = []
+    if show_messages:
+        config = get_cached_config()
+        collectors += [
+            ("git_info", lambda: get_git_info(paths), SESSION_COLLECTOR_BUDGETS["git_info"]),
+            ("personalization", lambda: load_user_personalization(paths),
+             SESSION_COLLECTOR_BUDGETS["personalization"]),
+            ("version", lambda: (get_moai_version(config, paths), check_version_update(paths)[0]),
+             SESSION_COLLECTOR_BUDGETS["version"]),
+            ("global_memory_summary", lambda: get_global_memory_summary(paths),
+             SESSION_COLLECTOR_BUDGETS["global_memory_summary"]),
+        ]
+    collectors.append(
+        ("global_rules", lambda: inject_global_rules(paths), SESSION_COLLECTOR_BUDGETS["global_rules"])
+    )
+    return collectors
+
+
+def get_missing_section_status(name: str, collector_timings: dict[str, dict[str, Any]] | None = None) -> str:
+    """Status shown for a section missing from the collector results.
+
+    Returns:
+        UNAVAILABLE if the collector raised, otherwise PENDING
+    """
+    status = (collector_timings or {}).get(name, {}).get("status")
+    return UNAVAILABLE if status == "error" else PENDING
+
+
+def format_missing_section(label: str, status: str) -> str:
+    """Format the output line for a section that has no result."""
+    icon = "⏳" if status == PENDING else "⚠️"
+    return f"   {icon} {label}: {status}"
+
+
+def format_global_rules_section(
+    sections: dict[str, Any], collector_timings: dict[str, dict[str, Any]] | None = None
+) -> str:
+    """Injected global rules, or a visible marker if the collector has no result.
+
+    The rules are the main payload of this hook, so a late or failed
+    collector is never dropped silently.
+    """
+    if "global_rules" in sections:
+        return sections["global_rules"]
+    status = get_missing_section_status("global_rules", collector_timings)
+    return "\n" + format_missing_section("Global Rules", status)
+
+
+def format_session_output(
+    paths: HookPaths | None = None,
+    sections: dict[str, Any] | None = None,
+    collector_timings: dict[str, dict[str, Any]] | None = None,
+) -> str:
+    """Format the complete session start output.
+
+    Args:
+        paths: Resolved hook paths (default: get_hook_paths())
+        sections: Collector results from run_collectors(); sections missing
+            from it are shown as pending (or unavailable if the collector
+            raised). If None, the collectors are run one after another.
+        collector_timings: Collector timings from run_collectors()
+    """
+    paths = paths or get_hook_paths()
+    if sections is None:
+        sections = {
+            name: func()
+            for name, func, _budget in get_session_collectors(paths)
+            if name != "global_rules"
+        }
+
     config = get_cached_config()
-    personalization = load_user_personalization()
+    def missing(name: str) -> str:
+        return get_missing_section_status(name, collector_timings)
 
-    try:
-        result = subprocess.run(["moai", "--version"], capture_output=True, text=True, check=True, timeout=5)
-        version_match = re.search(r"(\d+\.\d+\.\d+)", result.stdout)
-        moai_version = version_match.group(1) if version_match else "unknown"
-    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-        moai_version = "unknown"
-        if config:
-            moai_version = config.get("moai", {}).get("version", "unknown")
+    git_status = missing("git_info")
+    git_info = sections.get("git_info") or {"branch": git_status, "last_commit": git_status, "changes": git_status}
+    personalization = sections.get("personalization") or {}
+    moai_version, version_status = sections.get("version") or (missing("version"), "")
 
     lang_info = get_language_info(config)
     git_strategy = get_git_strategy_info(config)
-    version_status, _has_update = check_version_update()
 
     output = [
         "🚀 MoAI-ADK Session Started",
@@ -920,10 +1382,16 @@ def format_session_output() -> str:
         f"   🌐 Language: {lang_info['language_name']} ({lang_info['conversation_language']})",
     ]
 
-    global_memory_summary = get_global_memory_summary()
+    global_memory_summary = sections.get(
+        "global_memory_summary",
+        format_missing_section("Global Memory", missing("global_memory_summary")),
+    )
     if global_memory_summary:
         output.append(global_memory_summary)
 
+    if "personalization" not in sections:
+        output.append(format_missing_section("Personalization", missing("personalization")))
+
     conv_lang = personalization.get("conversation_language", "en")
 
     if personalization.get("needs_setup", False):
@@ -934,7 +1402,7 @@ def format_session_output() -> str:
             "en": "   👋 Welcome! Please run '/moai:0-project' to generate project documentation",
         }
         output.append(setup_messages.get(conv_lang, setup_messages["en"]))
-    elif personalization["has_personalization"]:
+    elif personalization.get("has_personalization", False):
         user_greeting = personalization.get("personalized_greeting", "")
         user_name = personalization.get("user_name", "")
         display_name = user_greeting if user_greeting else user_name
@@ -953,8 +1421,27 @@ def format_session_output() -> str:
     return "\n".join(output)
 
 
+def dump_hook_result(result: dict[str, Any], timer: PhaseTimer, **json_kwargs: Any) -> str:
+    """Serialize the hook result once, timing it when timing is enabled.
+
+    The printed output is serialized before the json_serialize span ends,
+    so that phase only appears in the timing log record, not in
+    performance.phases.
+    """
+    if not timer.enabled:
+        return json.dumps(result, **json_kwargs)
+
+    with timer.span("json_serialize"):
+        output = json.dumps(result, **json_kwargs)
+
+    collectors = result.get("performance", {}).get("collectors", {})
+    timer.write_log({"collectors": {name: timing.get("ms") for name, timing in collectors.items()}})
+    return output
+
+
 def main() -> None:
     """Main entry point for enhanced SessionStart hook."""
+    timer = PhaseTimer("SessionStart")
     timeout_config = HookTimeoutConfig(
         policy=TimeoutPolicy.NORMAL,
         custom_timeout_ms=5000,
@@ -965,20 +1452,32 @@ def main() -> None:
     )
 
     def execute_session_start():
-        input_data = sys.stdin.read() if not sys.stdin.isatty() else "{}"
-        _ = json.loads(input_data) if input_data.strip() else {}
+        with timer.span("stdin_read"):
+            input_data = sys.stdin.read() if not sys.stdin.isatty() else "{}"
+            _ = json.loads(input_data) if input_data.strip() else {}
+
+        with timer.span("path_resolution"):
+            paths = get_hook_paths()
 
         # Background auto-sync if needed
-        if should_auto_sync():
-            background_auto_sync()
+        with timer.span("auto_sync_decision"):
+            if should_auto_sync():
+                background_auto_sync(paths)
+
+        with timer.span("config_load"):
+            show_messages = should_show_setup_messages()
+
+        # Collectors run concurrently; whatever misses its budget is pending.
+        # Per-collector times (git info, personalization, rule injection...)
+        # are reported under performance.collectors.
+        with timer.span("collectors"):
+            sections, collector_timings = run_collectors(get_session_collectors(paths, show_messages))
 
-        show_messages = should_show_setup_messages()
-        session_output = format_session_output() if show_messages else ""
-        global_rules = inject_global_rules()
+        with timer.span("format_output"):
+            session_output = format_session_output(paths, sections, collector_timings) if show_messages else ""
+        global_rules = sections.get("global_rules", "")
 
-        full_system_message = session_output
-        if global_rules:
-            full_system_message += global_rules
+        full_system_message = session_output + format_global_rules_section(sections, collector_timings)
 
         result: dict[str, Any] = {
             "continue": True,
@@ -988,8 +1487,12 @@ def main() -> None:
                 "timeout_manager_used": get_timeout_manager() is not None,
                 "global_rules_loaded": len(global_rules) > 0,
                 "global_rules_chars": len(global_rules),
+                "path_stats": _path_stat_count,
+                "collectors": collector_timings,
             },
         }
+        if timer.enabled:
+            result["performance"]["phases"] = timer.phases
 
         return result
 
@@ -1001,7 +1504,7 @@ def main() -> None:
                 execute_session_start,
                 config=timeout_config,
             )
-            print(json.dumps(result, ensure_ascii=False))
+            print(dump_hook_result(result, timer, ensure_ascii=False))
             sys.exit(0)
 
         except HookTimeoutError as e:
@@ -1042,7 +1545,7 @@ def main() -> None:
 
             try:
                 result = execute_session_start()
-                print(json.dumps(result))
+                print(dump_hook_result(result, timer))
                 sys.exit(0)
 
             except PlatformTimeoutError:
@@ -1060,7 +1563,7 @@ def main() -> None:
         except ImportError:
             try:
                 result = execute_session_start()
-                print(json.dumps(result))
+                print(dump_hook_result(result, timer))
                 sys.exit(0)
             except Exception as e:
                 print(
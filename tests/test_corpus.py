@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Tests for benchmarks/corpus.py.
+
+Tests the synthetic rule corpus generator including:
+- Deterministic output
+- Unique IDs across all category ranges
+- Generated files passing validate_rules.py
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+
+# Add benchmarks and scripts directories to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "benchmarks"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from corpus import generate_memory, rule_number
+from validate_rules import find_all_rules, validate_category_range, validate_rules
+
+
+class TestCorpus(unittest.TestCase):
+    """Test cases for the corpus generator."""
+
+    def test_deterministic(self):
+        """Test that the same size and seed give identical output."""
+        self.assertEqual(generate_memory(50, seed=3), generate_memory(50, seed=3))
+        self.assertNotEqual(generate_memory(50, seed=3), generate_memory(50, seed=4))
+
+    def test_ids_cover_all_ranges(self):
+        """Test ID allocation over the seven category ranges."""
+        first_block = [rule_number(i) for i in range(693)]
+
+        self.assertEqual(len(set(first_block)), 693)
+        self.assertEqual(min(first_block), 1)
+        self.assertEqual(max(first_block), 699)
+        self.assertEqual({n // 100 for n in first_block}, set(range(7)))
+        self.assertEqual(rule_number(693), 1001)
+
+    def test_generated_rules_validate(self):
+        """Test that a generated file has no validation errors or category warnings."""
+        content = generate_memory(800)
+        rules = find_all_rules(content)
+        result = validate_rules(content, rules=rules)
+
+        self.assertEqual(len(rules), 800)
+        self.assertTrue(result.is_valid())
+        for rule in rules:
+            self.assertTrue(validate_category_range(rule["id"], rule["category"]), rule["id"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Tests for shared/git_metadata.py.
+
+Tests the subprocess-free git metadata reader including:
+- Branch and HEAD commit from loose and packed refs
+- Commit subject from loose and packed objects
+- Detached HEAD and worktree gitdir files
+- Unsupported SHA-256 repositories
+- Abbreviated sha length (core.abbrev and automatic)
+- Relative time formatting
+"""
+
+import os
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared.git_metadata import abbrev_length, find_git_dir, format_relative_time, read_git_metadata
+
+
+def git(cwd: Path, *args: str) -> str:
+    """Run a git command in cwd and return stripped stdout."""
+    env = dict(os.environ, GIT_AUTHOR_NAME="Test", GIT_AUTHOR_EMAIL="test@example.com",
+               GIT_COMMITTER_NAME="Test", GIT_COMMITTER_EMAIL="test@example.com")
+    result = subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True, env=env, check=True)
+    return result.stdout.strip()
+
+
+@unittest.skipUnless(shutil.which("git"), "git not available")
+class TestGitMetadata(unittest.TestCase):
+    """Test cases for the git metadata reader."""
+
+    def setUp(self):
+        """Create a repository with two commits."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.repo = Path(self.temp_dir) / "repo"
+        self.repo.mkdir()
+        git(self.repo, "init", "-q", "-b", "main")
+        for i in range(2):
+            (self.repo / "file.txt").write_text(f"content {i}\n", encoding="utf-8")
+            git(self.repo, "add", "file.txt")
+            git(self.repo, "commit", "-q", "-m", f"Commit number {i}\n\nBody text")
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def assertMatchesGit(self, metadata: dict, cwd: Path):
+        """Compare metadata with git's own answer."""
+        self.assertIsNotNone(metadata)
+        self.assertEqual(metadata["head_commit"], git(cwd, "rev-parse", "HEAD"))
+        self.assertEqual(metadata["subject"], git(cwd, "log", "-1", "--format=%s"))
+        self.assertEqual(metadata["author_time"], int(git(cwd, "log", "-1", "--format=%at")))
+
+    def test_loose_refs_and_objects(self):
+        """Test reading a freshly committed repository."""
+        metadata = read_git_metadata(self.repo)
+
+        self.assertEqual(metadata["branch"], "main")
+        self.assertFalse(metadata["detached"])
+        self.assertEqual(metadata["short_commit"], git(self.repo, "log", "-1", "--format=%h"))
+        self.assertMatchesGit(metadata, self.repo)
+
+    def test_core_abbrev(self):
+        """Test that core.abbrev sets the short commit length like %h."""
+        for value in ("12", "false"):
+            git(self.repo, "config", "core.abbrev", value)
+            metadata = read_git_metadata(self.repo)
+            self.assertEqual(metadata["short_commit"], git(self.repo, "log", "-1", "--format=%h"))
+
+    def test_automatic_abbrev_length(self):
+        """Test the automatic length grows with the packed object count."""
+        objects_dir = Path(self.temp_dir) / "objects"
+        (objects_dir / "pack").mkdir(parents=True)
+        self.assertEqual(abbrev_length({}, objects_dir), 7)
+
+        # v2 index header and fanout table claiming 2^20 objects
+        fanout = struct.pack(">256I", *([0] * 255 + [1 << 20]))
+        (objects_dir / "pack" / "pack-1.idx").write_bytes(b"\xfftOc\x00\x00\x00\x02" + fanout)
+        self.assertEqual(abbrev_length({}, objects_dir), 11)
+        self.assertEqual(abbrev_length({"core.abbrev": "9"}, objects_dir), 9)
+
+    def test_packed_refs_and_objects(self):
+        """Test reading after gc moved refs and objects into packs."""
+        git(self.repo, "gc", "-q")
+        self.assertFalse((self.repo / ".git" / "refs" / "heads" / "main").exists())
+
+        self.assertMatchesGit(read_git_metadata(self.repo), self.repo)
+
+    def test_detached_head(self):
+        """Test a detached HEAD has no branch name."""
+        git(self.repo, "checkout", "-q", "--detach", "HEAD~1")
+
+        metadata = read_git_metadata(self.repo)
+        self.assertEqual(metadata["branch"], "")
+        self.assertTrue(metadata["detached"])
+        self.assertMatchesGit(metadata, self.repo)
+
+    def test_worktree_gitdir_file(self):
+        """Test a linked worktree whose .git is a file."""
+        worktree = Path(self.temp_dir) / "worktree"
+        git(self.repo, "worktree", "add", "-q", "-b", "feature", str(worktree), "HEAD~1")
+
+        self.assertTrue((worktree / ".git").is_file())
+        self.assertTrue(find_git_dir(worktree).is_dir())
+
+        metadata = read_git_metadata(worktree)
+        self.assertEqual(metadata["branch"], "feature")
+        self.assertMatchesGit(metadata, worktree)
+
+    def test_unborn_branch(self):
+        """Test a repository without commits."""
+        empty = Path(self.temp_dir) / "empty"
+        empty.mkdir()
+        git(empty, "init", "-q", "-b", "main")
+
+        metadata = read_git_metadata(empty)
+        self.assertEqual(metadata["branch"], "main")
+        self.assertEqual(metadata["head_commit"], "")
+
+    def test_sha256_repository_not_supported(self):
+        """Test that a SHA-256 repository falls back to git instead of looking unborn."""
+        sha256_repo = Path(self.temp_dir) / "sha256"
+        sha256_repo.mkdir()
+        try:
+            git(sha256_repo, "init", "-q", "-b", "main", "--object-format=sha256")
+        except subprocess.CalledProcessError:
+            self.skipTest("git does not support --object-format=sha256")
+        (sha256_repo / "file.txt").write_text("content\n", encoding="utf-8")
+        git(sha256_repo, "add", "file.txt")
+        git(sha256_repo, "commit", "-q", "-m", "First commit")
+
+        self.assertIsNone(read_git_metadata(sha256_repo))
+
+        # Also when the objectformat extension is missing from the config
+        config_path = sha256_repo / ".git" / "config"
+        config_path.write_text(config_path.read_text(encoding="utf-8").replace("objectformat", "unused"),
+                               encoding="utf-8")
+        self.assertIsNone(read_git_metadata(sha256_repo))
+
+    def test_not_a_repository(self):
+        """Test a directory outside any repository."""
+        outside = Path(self.temp_dir) / "outside"
+        outside.mkdir()
+        if find_git_dir(outside) is None:
+            self.assertIsNone(read_git_metadata(outside))
+
+
+class TestFormatRelativeTime(unittest.TestCase):
+    """Test cases for git-style relative dates."""
+
+    def test_relative_times(self):
+        """Test relative date buckets match git's wording."""
+        now = 1_700_000_000
+        self.assertEqual(format_relative_time(now - 1, now), "1 second ago")
+        self.assertEqual(format_relative_time(now - 45, now), "45 seconds ago")
+        self.assertEqual(format_relative_time(now - 5 * 60, now), "5 minutes ago")
+        self.assertEqual(format_relative_time(now - 3 * 3600, now), "3 hours ago")
+        self.assertEqual(format_relative_time(now - 2 * 86400, now), "2 days ago")
+        self.assertEqual(format_relative_time(now - 21 * 86400, now), "3 weeks ago")
+        self.assertEqual(format_relative_time(now - 120 * 86400, now), "4 months ago")
+        self.assertEqual(format_relative_time(now - 400 * 86400, now), "1 year, 1 month ago")
+        self.assertEqual(format_relative_time(now - 3000 * 86400, now), "8 years ago")
+        self.assertEqual(format_relative_time(now + 60, now), "in the future")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Tests for hook_stats.py script.
+
+Tests the hook latency report including:
+- Percentile calculation
+- Aggregation per hook, tool_name and phase
+- Baseline regression detection
+- CSV export
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+
+# Add scripts directory to path
+scripts_dir = Path(__file__).parent.parent / "scripts"
+sys.path.insert(0, str(scripts_dir))
+
+from hook_stats import aggregate, build_baseline, find_regressions, format_csv, percentile
+
+
+def make_records():
+    """Ten SessionStart runs and two PreToolUse runs."""
+    records = [
+        {
+            "hook": "SessionStart",
+            "total_ms": float(10 * (i + 1)),
+            "phases": {"config_load": 1.0},
+            "collectors": {"git_info": float(i), "version": None},
+        }
+        for i in range(10)
+    ]
+    records.append({"hook": "PreToolUse", "tool_name": "Bash", "total_ms": 4.0, "phases": {}})
+    records.append({"hook": "PreToolUse", "tool_name": "Write", "total_ms": 6.0, "phases": {}})
+    return records
+
+
+class TestHookStats(unittest.TestCase):
+    """Test cases for hook_stats.py functionality."""
+
+    def test_percentile(self):
+        """Test interpolated percentiles."""
+        values = [10.0, 20.0, 30.0, 40.0, 50.0]
+        self.assertEqual(percentile(values, 50), 30.0)
+        self.assertEqual(percentile(values, 95), 48.0)
+        self.assertEqual(percentile([7.0], 99), 7.0)
+
+    def test_aggregate_groups(self):
+        """Test rows per hook, tool_name and phase."""
+        rows = {(r["hook"], r["tool_name"], r["phase"]): r for r in aggregate(make_records())}
+
+        total = rows[("SessionStart", "-", "total")]
+        self.assertEqual(total["count"], 10)
+        self.assertEqual(total["p50"], 55.0)
+        self.assertEqual(total["max"], 100.0)
+        self.assertEqual(rows[("SessionStart", "-", "collector.git_info")]["count"], 10)
+        self.assertNotIn(("SessionStart", "-", "collector.version"), rows)
+        self.assertEqual(rows[("PreToolUse", "Bash", "total")]["p99"], 4.0)
+
+    def test_find_regressions(self):
+        """Test that only large p95 increases are flagged."""
+        rows = aggregate(make_records())
+        baseline = build_baseline(rows)
+        self.assertEqual(find_regressions(rows, baseline), [])
+
+        slower = aggregate([dict(r, total_ms=r["total_ms"] * 2) for r in make_records()])
+        regressions = find_regressions(slower, baseline)
+        keys = {regression["key"] for regression in regressions}
+
+        self.assertIn("SessionStart|-|total", keys)
+        # PreToolUse grew by less than min_delta_ms
+        self.assertNotIn("PreToolUse|Bash|total", keys)
+
+    def test_format_csv(self):
+        """Test CSV export header and row count."""
+        lines = format_csv(aggregate(make_records())).splitlines()
+
+        self.assertEqual(lines[0], "hook,tool_name,phase,count,p50,p95,p99,max")
+        self.assertEqual(len(lines), 1 + 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
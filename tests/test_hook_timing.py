@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Tests for shared/hook_timing.py.
+
+Tests the opt-in hook phase timing including:
+- Disabled, output-only and log modes
+- JSONL log rotation
+- Reading records across rotated files
+"""
+
+import json
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared.hook_timing import PhaseTimer, append_timing_record, read_timing_records
+
+
+class TestPhaseTimer(unittest.TestCase):
+    """Test cases for phase timing spans."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.log_path = Path(self.temp_dir) / "hook_timings.jsonl"
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_disabled_by_default(self):
+        """Test that spans are not recorded when timing is off."""
+        timer = PhaseTimer("SessionStart", mode="")
+        with timer.span("stdin_read"):
+            pass
+        timer.write_log(log_path=self.log_path)
+
+        self.assertFalse(timer.enabled)
+        self.assertEqual(timer.phases, {})
+        self.assertFalse(self.log_path.exists())
+
+    def test_spans_recorded_without_log(self):
+        """Test that mode "1" records spans but writes no log."""
+        timer = PhaseTimer("SessionStart", mode="1")
+        with timer.span("config_load"):
+            pass
+        timer.write_log(log_path=self.log_path)
+
+        self.assertIn("config_load", timer.phases)
+        self.assertFalse(self.log_path.exists())
+
+    def test_log_mode_appends_record(self):
+        """Test that mode "log" appends one JSON line per run."""
+        timer = PhaseTimer("SessionStart", mode="log")
+        with timer.span("git_info"):
+            pass
+        timer.write_log({"collectors": {"git_info": 1.5}}, log_path=self.log_path)
+
+        record = json.loads(self.log_path.read_text(encoding="utf-8"))
+        self.assertEqual(record["hook"], "SessionStart")
+        self.assertIn("git_info", record["phases"])
+        self.assertEqual(record["collectors"], {"git_info": 1.5})
+
+    def test_rotation_and_read(self):
+        """Test that the log rotates and all files are read oldest first."""
+        for index in range(10):
+            append_timing_record({"hook": "SessionStart", "index": index}, self.log_path, max_bytes=80, backups=2)
+        with self.log_path.with_name("hook_timings.jsonl.1").open("a", encoding="utf-8") as f:
+            f.write("{truncated\n")
+
+        self.assertTrue(self.log_path.with_name("hook_timings.jsonl.2").exists())
+        self.assertFalse(self.log_path.with_name("hook_timings.jsonl.3").exists())
+
+        indexes = [record["index"] for record in read_timing_records(self.log_path, backups=2)]
+        self.assertEqual(indexes, sorted(indexes))
+        self.assertEqual(indexes[-1], 9)
+        self.assertLess(len(indexes), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,6 +11,7 @@ Tests the hook functionality including:
 
 import json
 import os
+import shutil
 import sys
 import tempfile
 import unittest
@@ -243,6 +244,232 @@ class TestSessionStartHook(unittest.TestCase):
         self.assertIn("SessionStart", content)
         self.assertIn('json.dumps', content)
 
+    def _load_template_hook(self):
+        """Import the template hook as a module."""
+        import importlib.util
+        spec = importlib.util.spec_from_file_location("session_start", self.template_hook_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    def test_parse_porcelain_v2_status(self):
+        """Test parsing batched git status output."""
+        module = self._load_template_hook()
+
+        output = "\n".join([
+            "# branch.oid 0123456789abcdef0123456789abcdef01234567",
+            "# branch.head main",
+            "# branch.upstream origin/main",
+            "# branch.ab +2 -1",
+            "1 .M N... 100644 100644 100644 abc abc README.md",
+            "? new_file.py",
+        ])
+        status = module._parse_porcelain_v2_status(output)
+
+        self.assertEqual(status["branch"], "main")
+        self.assertEqual(status["upstream"], "origin/main")
+        self.assertEqual(status["ahead"], 2)
+        self.assertEqual(status["behind"], 1)
+        self.assertEqual(status["changes"], 2)
+
+    def test_parse_porcelain_v2_status_detached(self):
+        """Test parsing status output for a detached HEAD."""
+        module = self._load_template_hook()
+
+        status = module._parse_porcelain_v2_status("# branch.oid abc\n# branch.head (detached)")
+
+        self.assertEqual(status["branch"], "(detached)")
+        self.assertEqual(status["upstream"], "")
+        self.assertEqual(status["changes"], 0)
+
+    def test_project_root_resolved_once(self):
+        """Test that collectors share one project root walk."""
+        module = self._load_template_hook()
+        project_root = Path(tempfile.mkdtemp())
+        (project_root / ".moai" / "config").mkdir(parents=True)
+        (project_root / ".claude").mkdir()
+        (project_root / ".claude" / "memory.md").write_text("project rule", encoding="utf-8")
+        nested = project_root / "src" / "pkg"
+        nested.mkdir(parents=True)
+
+        old_cwd = os.getcwd()
+        os.chdir(nested)
+        try:
+            with patch.object(module, "find_project_root", wraps=module.find_project_root) as find_mock:
+                module.get_cached_config()
+                module.get_cached_spec_progress()
+                module.check_git_initialized()
+                module.check_version_update()
+                rules = module.inject_global_rules()
+                module.get_global_memory_summary()
+                self.assertEqual(find_mock.call_count, 1)
+        finally:
+            os.chdir(old_cwd)
+            shutil.rmtree(project_root, ignore_errors=True)
+
+        self.assertEqual(module.get_hook_paths().project_root.resolve(), project_root.resolve())
+        self.assertIn("project rule", rules)
+
+    def test_path_stats_counts_stat_calls_across_threads(self):
+        """Test that stat() calls are counted and the counter is thread-safe."""
+        import threading
+        module = self._load_template_hook()
+        start = module._path_stat_count
+
+        module.path_stat(Path(__file__))
+        module.path_exists(Path(__file__))
+        threads = [
+            threading.Thread(target=lambda: [module.count_path_stats() for _ in range(1000)])
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(module._path_stat_count - start, 2 + 8000)
+
+    def test_dump_hook_result_serializes_once(self):
+        """Test that timing measures the one real serialization."""
+        import json
+        sys.path.insert(0, str(Path(__file__).parent.parent))
+        from shared.hook_timing import PhaseTimer
+
+        module = self._load_template_hook()
+        timer = PhaseTimer("SessionStart", mode="log")
+        result = {"continue": True, "performance": {"collectors": {"git_info": {"status": "ok", "ms": 1.0}},
+                                                    "phases": timer.phases}}
+
+        with patch.object(module.json, "dumps", wraps=json.dumps) as dumps_mock, \
+                patch.object(timer, "write_log") as write_log_mock:
+            output = module.dump_hook_result(result, timer, ensure_ascii=False)
+
+        self.assertEqual(dumps_mock.call_count, 1)
+        self.assertNotIn("json_serialize", json.loads(output)["performance"]["phases"])
+        self.assertIn("json_serialize", timer.phases)
+        write_log_mock.assert_called_once_with({"collectors": {"git_info": 1.0}})
+
+    def test_config_cache_reused_until_changed(self):
+        """Test that config files are parsed once and re-parsed after a change."""
+        project_root = Path(tempfile.mkdtemp())
+        config_dir = project_root / ".moai" / "config"
+        (config_dir / "sections").mkdir(parents=True)
+        (config_dir / "config.yaml").write_text("project:\n  initialized: true\n", encoding="utf-8")
+        language_path = config_dir / "sections" / "language.yaml"
+        language_path.write_text("language:\n  conversation_language: ko\n", encoding="utf-8")
+
+        old_cwd = os.getcwd()
+        os.chdir(project_root)
+        try:
+            module = self._load_template_hook()
+            config = module.get_cached_config()
+            self.assertTrue(config["project"]["initialized"])
+            self.assertEqual(config["language"]["conversation_language"], "ko")
+            self.assertTrue((project_root / ".moai" / "cache" / "config-cache.json").exists())
+
+            # A new hook run reads the snapshot without parsing any YAML
+            module = self._load_template_hook()
+            with patch.object(module, "_load_yaml_file") as load_mock:
+                self.assertEqual(module.get_cached_config(), config)
+                self.assertEqual(module.get_cached_config(), config)
+                load_mock.assert_not_called()
+
+            language_path.write_text(
+                "language:\n  conversation_language: ja\n  conversation_language_name: Japanese\n",
+                encoding="utf-8"
+            )
+            module = self._load_template_hook()
+            config = module.get_cached_config()
+            self.assertEqual(config["language"]["conversation_language"], "ja")
+        finally:
+            os.chdir(old_cwd)
+            shutil.rmtree(project_root, ignore_errors=True)
+
+    def test_run_collectors_budgets(self):
+        """Test that slow collectors are pending and errors are isolated."""
+        import threading
+        module = self._load_template_hook()
+        release = threading.Event()
+
+        def fail():
+            raise OSError("disk gone")
+
+        results, timings = module.run_collectors([
+            ("fast", lambda: "done", 1.0),
+            ("slow", lambda: release.wait(5), 0.05),
+            ("broken", fail, 1.0),
+        ])
+        release.set()
+
+        self.assertEqual(results, {"fast": "done"})
+        self.assertEqual(timings["fast"]["status"], "ok")
+        self.assertEqual(timings["slow"]["status"], "pending")
+        self.assertEqual(timings["broken"]["status"], "error")
+        self.assertIn("disk gone", timings["broken"]["error"])
+
+    def test_format_session_output_marks_pending_sections(self):
+        """Test that sections missing after the deadline are shown as pending."""
+        module = self._load_template_hook()
+
+        output = module.format_session_output(sections={})
+
+        self.assertIn("Branch: pending", output)
+        self.assertIn("Version: pending", output)
+        self.assertIn("Global Memory: pending", output)
+        self.assertIn("Personalization: pending", output)
+        self.assertIn("Global Rules: pending", module.format_global_rules_section({}))
+
+    def test_failed_sections_marked_unavailable(self):
+        """Test that sections whose collector raised are not shown as pending."""
+        module = self._load_template_hook()
+        timings = {
+            name: {"status": "error", "ms": 1.0, "error": "OSError: disk gone"}
+            for name in ("git_info", "personalization", "version", "global_memory_summary", "global_rules")
+        }
+
+        output = module.format_session_output(sections={}, collector_timings=timings)
+
+        self.assertIn("Branch: unavailable", output)
+        self.assertIn("Version: unavailable", output)
+        self.assertIn("Global Memory: unavailable", output)
+        self.assertIn("Personalization: unavailable", output)
+        self.assertNotIn("pending", output)
+        self.assertIn("Global Rules: unavailable", module.format_global_rules_section({}, timings))
+        self.assertEqual(module.format_global_rules_section({"global_rules": "rules"}), "rules")
+
+    @unittest.skipIf(sys.platform == "win32", "uses a shell script as the moai executable")
+    def test_moai_version_cached_per_executable(self):
+        """Test that `moai --version` is spawned only when the executable changes."""
+        temp_dir = Path(tempfile.mkdtemp())
+        project_root = temp_dir / "project"
+        (project_root / ".moai").mkdir(parents=True)
+        bin_dir = temp_dir / "bin"
+        bin_dir.mkdir()
+        calls_path = temp_dir / "calls"
+        moai_path = bin_dir / "moai"
+        moai_path.write_text(f'#!/bin/sh\necho x >> "{calls_path}"\necho "MoAI-ADK, version 1.2.3"\n')
+        moai_path.chmod(0o755)
+
+        old_cwd = os.getcwd()
+        os.chdir(project_root)
+        try:
+            with patch.dict(os.environ, {"PATH": f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}"}):
+                for _ in range(2):
+                    module = self._load_template_hook()
+                    with patch("importlib.metadata.version", side_effect=ImportError):
+                        self.assertEqual(module.get_moai_version(None), "1.2.3")
+                self.assertEqual(len(calls_path.read_text().splitlines()), 1)
+
+                stat = moai_path.stat()
+                os.utime(moai_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+                module = self._load_template_hook()
+                with patch("importlib.metadata.version", side_effect=ImportError):
+                    module.get_moai_version(None)
+                self.assertEqual(len(calls_path.read_text().splitlines()), 2)
+        finally:
+            os.chdir(old_cwd)
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
 
 class TestHookIntegration(unittest.TestCase):
     """Integration tests for hook system."""
@@ -120,6 +120,19 @@ class TestInstallScript(unittest.TestCase):
         self.assertIn("def main(", content)
         self.assertIn("SessionStart", content)
 
+    def test_powershell_installs_hook_libs(self):
+        """Test that install.ps1 copies the same hook lib modules as install.py."""
+        import re
+        from install import HOOK_LIB_FILES
+
+        ps1_path = Path(__file__).parent.parent / "scripts" / "install.ps1"
+        content = ps1_path.read_text(encoding="utf-8")
+        match = re.search(r"\$HookLibFiles = @\((.*?)\)", content, re.DOTALL)
+
+        self.assertIsNotNone(match)
+        self.assertEqual(re.findall(r'"([^"]+)"', match.group(1)), HOOK_LIB_FILES)
+        self.assertIn("(Install-HookLibs)", content)
+
 
 class TestValidateRulesScript(unittest.TestCase):
     """Test cases for validate_rules.py script."""
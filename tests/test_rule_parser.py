@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Tests for shared/rule_parser.py.
+
+Tests the single-pass rule parser including:
+- Field extraction
+- Rule boundaries
+- Line numbers and character/byte offsets
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared.rule_parser import iter_rules, parse_rules
+
+
+class TestRuleParser(unittest.TestCase):
+    """Test cases for the single-pass rule parser."""
+
+    SAMPLE = """# Memory
+
+## 4. Common Errors
+
+### ERR-XXX: [Template Title]
+**Problem**: Not a rule
+
+### ERR-001: First Error
+**Problem**: Problem 1
+**Root Cause**: Cause 1
+**Solution**: Solution 1
+**Prevention**: Prevention 1
+**Date**: 2024-01-15
+**Category**: General (ERR-001~ERR-099)
+
+### ERR-002: 한글 제목
+**Problem**: 파일 경로 오류
+**Solution**: Solution 2
+
+## 5. Other Section
+**Problem**: Outside any rule
+"""
+
+    def test_parse_fields(self):
+        """Test that all fields are extracted."""
+        rules = parse_rules(self.SAMPLE)
+
+        self.assertEqual([r['id'] for r in rules], ['ERR-001', 'ERR-002'])
+        first = rules[0]
+        self.assertEqual(first['title'], 'First Error')
+        self.assertEqual(first['problem'], 'Problem 1')
+        self.assertEqual(first['root_cause'], 'Cause 1')
+        self.assertEqual(first['solution'], 'Solution 1')
+        self.assertEqual(first['prevention'], 'Prevention 1')
+        self.assertEqual(first['date'], '2024-01-15')
+        self.assertIn('ERR-001~ERR-099', first['category'])
+
+    def test_rule_stops_at_section(self):
+        """Test that a rule block ends at the next ## section."""
+        rules = parse_rules(self.SAMPLE)
+
+        self.assertEqual(rules[1]['problem'], '파일 경로 오류')
+        self.assertEqual(rules[1]['root_cause'], '')
+
+    def test_line_numbers(self):
+        """Test 1-based line numbers of rule headers."""
+        lines = self.SAMPLE.split("\n")
+        for rule in iter_rules(self.SAMPLE):
+            self.assertTrue(lines[rule['line'] - 1].startswith(f"### {rule['id']}:"))
+            self.assertGreater(rule['end_line'], rule['line'])
+
+    def test_offsets(self):
+        """Test character and UTF-8 byte offsets point at the rule block."""
+        data = self.SAMPLE.encode("utf-8")
+        for rule in iter_rules(self.SAMPLE):
+            block = self.SAMPLE[rule['offset']:rule['end_offset']]
+            self.assertTrue(block.startswith(f"### {rule['id']}:"))
+            self.assertEqual(
+                data[rule['byte_offset']:rule['end_byte_offset']].decode("utf-8"),
+                block
+            )
+
+    def test_rule_at_end_of_file(self):
+        """Test a rule that runs to the end of the content."""
+        content = "### ERR-100: Last Rule\n**Solution**: Push later"
+        rules = parse_rules(content)
+
+        self.assertEqual(len(rules), 1)
+        self.assertEqual(rules[0]['solution'], 'Push later')
+        self.assertEqual(rules[0]['end_offset'], len(content))
+
+    def test_empty_content(self):
+        """Test parsing empty content."""
+        self.assertEqual(parse_rules(""), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Tests for shared/rule_snapshot.py.
+
+Tests the compiled rule snapshot including:
+- Snapshot compilation
+- Reuse while memory.md is unchanged
+- Invalidation on content change
+- On-demand rule list kept out of the snapshot
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared import rule_snapshot
+from shared.rule_snapshot import compile_snapshot, load_rule_snapshot, load_snapshot_rules
+
+
+SAMPLE_MEMORY = """# Global Development Memory
+
+**Last Updated**: 2026-02-06
+
+## 4. Common Errors Across All Projects (Claude Code Working)
+
+### ERR-001: TodoWrite Tool Not Available
+**Problem**: Tool not available
+**Solution**: Use TaskCreate instead
+
+### ERR-004: File Path Not Found
+**Problem**: File does not exist
+**Solution**: Use Glob to verify
+
+### ERR-017: Not Essential
+**Problem**: Outside the essential range
+
+## 5. Quick Reference
+
+| Error ID | Description | Quick Solution |
+|----------|-------------|----------------|
+| ERR-001 | TodoWrite unavailable | Use TaskCreate |
+| ERR-004 | File path wrong | Use Glob first |
+"""
+
+
+class TestRuleSnapshot(unittest.TestCase):
+    """Test cases for the compiled rule snapshot."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.memory_path = Path(self.temp_dir) / "memory.md"
+        self.snapshot_path = Path(self.temp_dir) / "cache" / "rules_snapshot.json"
+        self.memory_path.write_text(SAMPLE_MEMORY, encoding="utf-8")
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        import shutil
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def test_compile_snapshot(self):
+        """Test snapshot contents."""
+        snapshot = compile_snapshot(SAMPLE_MEMORY)
+
+        self.assertEqual(snapshot["rule_count"], 3)
+        self.assertEqual(snapshot["last_updated"], "2026-02-06")
+        self.assertNotIn("rules", snapshot)
+        self.assertIn("| ERR-004 |", snapshot["quick_reference"])
+
+        essential = "\n".join(snapshot["essential_rules"])
+        self.assertIn("ERR-004", essential)
+        self.assertNotIn("ERR-017", essential)
+
+    def test_snapshot_written_and_reused(self):
+        """Test that an unchanged file is served from the snapshot."""
+        first = load_rule_snapshot(self.memory_path, self.snapshot_path)
+        self.assertTrue(self.snapshot_path.exists())
+        self.assertEqual(first["source"]["size"], self.memory_path.stat().st_size)
+
+        with patch.object(rule_snapshot, "compile_snapshot") as compile_mock:
+            second = load_rule_snapshot(self.memory_path, self.snapshot_path)
+            compile_mock.assert_not_called()
+
+        self.assertEqual(second["rule_count"], 3)
+
+    def test_touched_file_reuses_snapshot(self):
+        """Test that an mtime-only change is resolved by the content hash."""
+        load_rule_snapshot(self.memory_path, self.snapshot_path)
+        stat = self.memory_path.stat()
+        os.utime(self.memory_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+        with patch.object(rule_snapshot, "compile_snapshot") as compile_mock:
+            snapshot = load_rule_snapshot(self.memory_path, self.snapshot_path)
+            compile_mock.assert_not_called()
+
+        self.assertEqual(snapshot["source"]["mtime_ns"], self.memory_path.stat().st_mtime_ns)
+
+    def test_changed_file_rebuilds_snapshot(self):
+        """Test that a content change rebuilds the snapshot."""
+        load_rule_snapshot(self.memory_path, self.snapshot_path)
+        self.memory_path.write_text(
+            SAMPLE_MEMORY + "\n### ERR-100: Push Rejected\n**Problem**: Remote ahead\n",
+            encoding="utf-8"
+        )
+
+        snapshot = load_rule_snapshot(self.memory_path, self.snapshot_path)
+        self.assertEqual(snapshot["rule_count"], 4)
+
+    def test_corrupt_snapshot_is_rebuilt(self):
+        """Test that an unreadable snapshot file is ignored."""
+        self.snapshot_path.parent.mkdir(parents=True)
+        self.snapshot_path.write_text("{not json", encoding="utf-8")
+
+        snapshot = load_rule_snapshot(self.memory_path, self.snapshot_path)
+        self.assertEqual(snapshot["rule_count"], 3)
+
+    def test_rule_list_loaded_on_demand(self):
+        """Test that the parsed rules live in a separate file."""
+        rules_path = Path(self.temp_dir) / "cache" / "rules_snapshot_rules.json"
+        load_rule_snapshot(self.memory_path, self.snapshot_path)
+        self.assertFalse(rules_path.exists())
+
+        rules = load_snapshot_rules(self.memory_path, rules_path)
+        self.assertEqual([r["id"] for r in rules], ["ERR-001", "ERR-004", "ERR-017"])
+        self.assertTrue(rules_path.exists())
+
+        with patch.object(rule_snapshot, "compile_rule_list") as compile_mock:
+            self.assertEqual(len(load_snapshot_rules(self.memory_path, rules_path)), 3)
+            compile_mock.assert_not_called()
+
+    def test_missing_memory_raises(self):
+        """Test that a missing memory file raises OSError."""
+        with self.assertRaises(OSError):
+            load_rule_snapshot(Path(self.temp_dir) / "missing.md", self.snapshot_path)
+
+
+if __name__ == "__main__":
+    unittest.main()